@@ -1,8 +1,14 @@
+import mmap
 import re
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
+from typing import Mapping
 
 from src import Day
 
+# the bytes of a document each worker sums at a time
+CHUNK_SIZE = 1 << 26
+
 
 class Digits(Enum):
     ONE = 1
@@ -16,36 +22,158 @@ class Digits(Enum):
     NINE = 9
 
 
-class Day1(Day):
+class Vocabulary:
     """
-    Class representing the solution for Day 1 of the Advent of Code challenge.
+    Digit tokens, compiled once into a pattern that finds the first and the
+    last token of a line in a single search.
+
+    At the leftmost position where a token starts, one lookahead captures
+    it and another skips greedily to the last token starting there or
+    later. Neither consumes any characters, so overlapping tokens like the
+    "two" of "eightwo" are found without rewriting the line. Where tokens
+    start at the same position, the longest wins.
     """
 
-    @staticmethod
-    def _filter_data(data: list) -> list:
+    def __init__(self, tokens: Mapping[str, int]) -> None:
+        self.values = dict(tokens)
+        alternation = "|".join(
+            re.escape(token) for token in sorted(tokens, key=len, reverse=True)
+        )
+        lookahead = f"(?=({alternation}))(?=.*({alternation}))"
+        self.pattern = re.compile(lookahead)
+        # the same from the start of every line, capturing nothing when the
+        # line holds no digit, and consuming the whole line so that the
+        # next match starts at the next line, to scan a document at once
+        self.codes = {token.encode(): value for token, value in tokens.items()}
+        self.document = re.compile(f"^(?:.*?{lookahead})?.*".encode(), re.M)
+
+    def __or__(self, other: "Vocabulary") -> "Vocabulary":
+        return Vocabulary(self.values | other.values)
+
+    def calibration(self, line: str) -> int:
         """
-        Filter the data by removing non-digit characters.
+        Combine the first and last digit of a line into a number.
 
         Args:
-            data (list): The data to filter.
+            line (str): The line.
+
+        Raises:
+            ValueError: If the line holds no digit.
 
         Returns:
-            list: The filtered data.
+            int: Ten times the first digit plus the last digit.
+        """
+        if (match := self.pattern.search(line)) is None:
+            raise ValueError(f"no digit in {line!r}")
+        first, last = match.groups()
+        return self.values[first] * 10 + self.values[last]
+
+    def total(
+        self, buffer: bytes, start: int = 0, end: int | None = None
+    ) -> int:
         """
-        return [re.sub(r"\D", "", line) for line in data]
+        Sum the calibration values of the lines of a document.
+
+        The lines are matched in place, so no line is ever copied out of
+        the buffer.
+
+        Args:
+            buffer (bytes): The document, e.g. memory-mapped.
+            start (int): Where the first line starts.
+            end (int | None): Where the lines end, defaults to the end of
+                the buffer.
+
+        Raises:
+            ValueError: If a line holds no digit.
 
-    @classmethod
-    def _numerize(cls, data: list) -> list:
+        Returns:
+            int: The sum of the calibration values.
         """
-        Convert the filtered data into a list of numbers.
+        end = len(buffer) if end is None else end
+        codes, total = self.codes, 0
+        for match in self.document.finditer(buffer, start, end):
+            first, last = match.groups()
+            if first is None:
+                if match.start() == end:
+                    break
+                raise ValueError(
+                    f"no digit in the line at byte {match.start()}"
+                )
+            total += codes[first] * 10 + codes[last]
+        return total
+
+
+NUMERALS = Vocabulary({str(digit.value): digit.value for digit in Digits})
+SPELLED = NUMERALS | Vocabulary(
+    {digit.name.lower(): digit.value for digit in Digits}
+)
+
+
+def chunks(buffer: bytes, size: int = CHUNK_SIZE) -> list[tuple[int, int]]:
+    """
+    Split a document into chunks of about a size, ending at line breaks.
+
+    Args:
+        buffer (bytes): The document.
+        size (int): The number of bytes per chunk.
+
+    Returns:
+        list[tuple[int, int]]: The start and end of every chunk.
+    """
+    bounds, start = [], 0
+    while start < len(buffer):
+        end = buffer.find(b"\n", min(start + size, len(buffer)) - 1) + 1
+        end = end or len(buffer)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def _chunk_total(
+    path: str, vocabulary: Vocabulary, start: int, end: int
+) -> int:
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return vocabulary.total(buffer, start, end)
+
+
+class Day1(Day):
+    """
+    Class representing the solution for Day 1 of the Advent of Code challenge.
+
+    In streaming mode a document on disk is summed in newline-aligned chunks
+    by a pool of workers, each mapping the file on its own, so throughput
+    scales with the cores and memory stays bounded by the chunk size.
+    """
+
+    # the size of the pool summing the chunks, defaults to the CPU count
+    workers: int | None = None
+
+    def total(self, vocabulary: Vocabulary) -> int:
+        """
+        Sum the calibration values of the document under a vocabulary.
 
         Args:
-            data (list): The filtered data.
+            vocabulary (Vocabulary): The digit tokens to find.
 
         Returns:
-            list: The numerized data.
+            int: The sum of the calibration values.
         """
-        return [int(x[0]) * 10 + int(x[-1]) for x in cls._filter_data(data)]
+        if not self.streaming:
+            return sum(map(vocabulary.calibration, self.lines))
+        if isinstance(self._input, bytes):
+            return vocabulary.total(self.buffer)
+
+        # the map only reads the pages around the chunk boundaries
+        bounds = chunks(self._load())
+        if len(bounds) <= 1:
+            return vocabulary.total(self.buffer)
+        with ProcessPoolExecutor(self.workers) as pool:
+            totals = [
+                pool.submit(_chunk_total, self._input, vocabulary, start, end)
+                for start, end in bounds
+            ]
+            return sum(total.result() for total in totals)
 
     def part_1(self) -> int:
         """
@@ -54,37 +182,21 @@ class Day1(Day):
         Returns:
             int: The solution for part 1.
         """
-        return sum(self._numerize(self.data))
+        return self.total(NUMERALS)
 
     def part_2(self) -> int:
         """
         Solve part 2 of the challenge.
 
-        The trick here is that the strings of digits that are being replaced by
-        numbers can have their characters overlap with the string of another
-        digit. For example, "eightwo" should be replaced with "82". This is why
-        replacing the whole world with a number doesn't work. Instead, we need
-        to replace the middle characters of the number and leave the first and
-        last characters intact.
+        The trick here is that spelled out digits can overlap with another
+        digit. For example, "eightwo" holds both 8 and 2, so the line cannot
+        be scanned by replacing whole words with numbers. The vocabulary
+        finds the first and last digit in place instead.
 
         Returns:
             int: The solution for part 2.
         """
-        temp = self.data
-        for digit in Digits:
-            temp = [
-                re.sub(
-                    digit.name.lower(),
-                    (
-                        f"{digit.name[0]}{str(digit.value)}"
-                        f"{digit.name[-1]}"
-                    ).lower(),
-                    line,
-                )
-                for line in temp
-            ]
-
-        return sum(self._numerize(temp))
+        return self.total(SPELLED)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,5 @@
-from src import Day
+from src import Day, Grid
 from functools import cached_property
-from collections import deque
 from enum import Enum
 
 
@@ -28,72 +27,56 @@ class Pipe(Enum):
 
 class Day10(Day):
     @cached_property
-    def data(self):
-        output = []
-        for line in self.raw_data:
-            output.append([Pipe(x) for x in line])
+    def grid(self) -> Grid:
+        return Grid(self.raw_data, fill=".")
 
-        return output
+    @cached_property
+    def connections(self) -> dict[int, tuple[int, ...]]:
+        """
+        The flat offsets each pipe connects to, keyed by its character.
+
+        Returns:
+            dict[int, tuple[int, ...]]: The offsets, keyed by byte value.
+        """
+        return {
+            ord(pipe.value): tuple(
+                dr * self.grid.stride + dc for dr, dc in pipe.directions
+            )
+            for pipe in Pipe
+        }
 
     @property
-    def start(self):
-        for idx, line in enumerate(self.data):
-            for jdx, pipe in enumerate(line):
-                if pipe == Pipe.START:
-                    return pipe, (idx, jdx)
-
-    def __getitem__(self, idx: tuple[int, int]):
-        return self.data[idx[0]][idx[1]], idx
-
-    def _neighbours(self, node: tuple[Pipe, tuple[int, int]]):
-        pipe, loc = node
-        neighbours = []
-
-        for direction in pipe.directions:
-            ln = (loc[0] + direction[0], loc[1] + direction[1])
-            if (ln[0] < 0 or ln[1] < 0) or (
-                ln[0] >= len(self.data) or ln[1] >= len(self.data[ln[0]])
-            ):
-                continue
-
-            neighbours.append(self[ln])
+    def start(self) -> int:
+        return self.grid.find(Pipe.START.value)
 
-        return neighbours
-
-    def _next(self, node: tuple[Pipe, tuple[int, int]]):
-        neighbours = self._neighbours(node)
-
-        for i, n in enumerate(neighbours):
-            rns = self._neighbours(n)
-            if node not in rns:
-                neighbours.pop(i)
-
-        return neighbours
+    def _neighbours(self, node: int) -> list[int]:
+        # the border is ground, so pipes on the edge never leave the grid
+        return [node + o for o in self.connections[self.grid.bytes[node]]]
 
     def plot(self):
-        plt = []
-        for line in self.data:
-            plt.append(["." for x in line])
-
+        plt = [["."] * self.grid.width for _ in range(self.grid.height)]
         for node in self.loop:
-            plt[node[1][0]][node[1][1]] = "#"
+            r, c = self.grid.coords(node)
+            plt[r][c] = "#"
 
         return plt
 
     @cached_property
-    def loop(self):
-        loop = deque([self.start, self._next(self.start)[0]])
-        while True:
-            next = list(filter(lambda x: x not in loop, self._next(loop[-1])))
-            if len(next) != 0:
-                loop.extend(next)
-            else:
-                break
+    def loop(self) -> list[int]:
+        start = self.start
+        node = next(
+            n for n in self._neighbours(start) if start in self._neighbours(n)
+        )
+        loop = [start]
+        while node != start:
+            previous = loop[-1]
+            loop.append(node)
+            node = next(n for n in self._neighbours(node) if n != previous)
         return loop
 
     @property
     def area(self):
-        loop = [x[1] for x in self.loop]
+        loop = [self.grid.coords(x) for x in self.loop]
         return int(
             0.5
             * abs(
@@ -104,12 +87,14 @@ class Day10(Day):
             )
         )
 
+    def parse(self) -> None:
+        self.grid
+
     def part_1(self):
         return len(self.loop) // 2
 
     def part_2(self):
         return self.area - len(self.loop) // 2 + 1
-        pass
 
 
 if __name__ == "__main__":
@@ -1,42 +1,47 @@
-from src import Day
-from collections import defaultdict
+from src import Day, Grid, lazy_import
+from functools import cached_property
+import operator
+
+np = lazy_import("numpy")
 
 
 class Day11(Day):
+    @cached_property
+    def grid(self) -> Grid:
+        return Grid(self.raw_data, pad=0)
+
     def galaxies(self, expand=1):
-        galaxies = []
-        ecols = defaultdict(bool)
-        i = 0
-        for row in self.raw_data:
-            j = 0
-            if all([x == "." for x in row]):
-                i += expand
-            else:
-                for c, v in enumerate(row):
-                    if c not in ecols:
-                        col = [x[c] for x in self.raw_data]
-                        if all([x == "." for x in col]):
-                            ecols[c] = True
-
-                    j += ecols[c] * expand
-
-                    if v == "#":
-                        galaxies.append((i, j))
-
-                    j += 1
-            i += 1
-
-        return galaxies
+        galaxies = self.grid == "#"
+        rows, cols = galaxies.nonzero()
+        # coordinates that may not fit in int64 are kept as Python ints
+        size = self.grid.height + self.grid.width
+        fits = size * (expand + 1) <= np.iinfo(np.int64).max
+        dtype = np.int64 if fits else object
+        # every empty row or column before a galaxy pushes it further out
+        empty_rows = np.cumsum(~galaxies.any(axis=1)).astype(dtype) * expand
+        empty_cols = np.cumsum(~galaxies.any(axis=0)).astype(dtype) * expand
+        return rows + empty_rows[rows], cols + empty_cols[cols]
+
+    @staticmethod
+    def _pairwise(x):
+        # sum of |x_i - x_j| over all pairs, from the sorted coordinates
+        x = np.sort(x)
+        n = len(x)
+        if not n:
+            return 0
+        weights = 2 * np.arange(n, dtype=np.int64) - n + 1
+        # every partial sum is at most max(x) * n^2 / 2, past int64 the
+        # products are summed as Python ints
+        if int(x[-1]) * n * n // 2 <= np.iinfo(np.int64).max:
+            return int(np.dot(x.astype(np.int64), weights))
+        return sum(map(operator.mul, x.tolist(), weights.tolist()))
 
     def solve(self, expand=1):
-        distances = []
-        gs = self.galaxies(expand)
-        while len(gs) > 0:
-            g = gs.pop()
-            for g2 in gs:
-                distances.append(abs(g[0] - g2[0]) + abs(g[1] - g2[1]))
-
-        return sum(distances)
+        rows, cols = self.galaxies(expand)
+        return self._pairwise(rows) + self._pairwise(cols)
+
+    def parse(self) -> None:
+        self.grid
 
     def part_1(self):
         return self.solve()
@@ -1,40 +1,20 @@
-from src import Day
+from src import Day, Grid
 from functools import cached_property
 
 
 class Day13(Day):
     @cached_property
     def data(self):
-        maps = [[]]
-        for line in self.raw_data:
-            if line == "":
-                maps.append([])
-            else:
-                maps[-1].append(line)
-        return maps
+        return [Grid(record, pad=0) for record in self.iter_records()]
 
     def map(self, idx, transposed=False):
-        if transposed:
-            return ["".join(x) for x in zip(*self.data[idx])]
-        else:
-            return self.data[idx]
+        cells = self.data[idx].cells
+        return cells.T if transposed else cells
 
     def _reflect(self, mp, dist=0):
-        i = 0
-        while i < len(mp) - 1:
-            i += 1
-            am = mp[:i]
-            pm = mp[i:]
-            n = min(len(am), len(pm))
-            if (
-                sum(
-                    [
-                        x != y
-                        for x, y in zip("".join(am[::-1][:n]), "".join(pm[:n]))
-                    ]
-                )
-                == dist
-            ):
+        for i in range(1, len(mp)):
+            n = min(i, len(mp) - i)
+            if (mp[i - n : i][::-1] != mp[i : i + n]).sum() == dist:
                 return i
 
         return False
@@ -49,13 +29,13 @@ class Day13(Day):
     def part_1(self):
         ans = 0
         for i in range(len(self.data)):
-            ans += d.reflection(i, dist=0)
+            ans += self.reflection(i, dist=0)
         return ans
 
     def part_2(self):
         ans = 0
         for i in range(len(self.data)):
-            ans += d.reflection(i, dist=1)
+            ans += self.reflection(i, dist=1)
         return ans
 
 
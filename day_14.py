@@ -1,50 +1,39 @@
-from src import Day
+from src import Day, Grid, lazy_import
 from functools import cached_property
-from collections import deque
-from hashlib import sha1
+
+np = lazy_import("numpy")
+
+ROUND, CUBE, EMPTY = ord("O"), ord("#"), ord(".")
 
 
 class Day14(Day):
     @cached_property
     def data(self):
-        output = []
-        for line in self.raw_data:
-            output.append(tuple([x for x in line]))
-        return output
+        return Grid(self.raw_data, fill="#").array
 
     @staticmethod
-    def transpose(array: list[list[str]]):
-        return [list(i) for i in zip(*array)]
-
-    @classmethod
-    def tilt(cls, array: list[list[str]], flip=False):
-        if flip:
-            return tuple([cls._sort(x[::-1])[::-1] for x in array])
-        else:
-            return tuple([cls._sort(x) for x in array])
-
-    @staticmethod
-    def _sort(line):
-        q = deque(line)
-        s = deque()
-        t = deque()
-        while q:
-            i = q.popleft()
-            if i == "O":
-                s.append(i)
-            elif i == ".":
-                t.append(i)
-            else:
-                s.extend(t)
-                t = deque()
-                s.append(i)
-        if t:
-            s.extend(t)
-        return tuple(s)
+    def tilt(array):
+        """
+        Roll the round rocks of every row towards its start.
+
+        Every row starts with a cube rock, so each cube rock starts a
+        segment, and a segment holding k round rocks ends up with them in
+        its first k cells after the cube rock.
+        """
+        flat = array.ravel()
+        cubes = flat == CUBE
+        starts = np.flatnonzero(cubes)
+        segment = np.cumsum(cubes) - 1
+        counts = np.bincount(segment, weights=flat == ROUND).astype(np.intp)
+        offset = np.arange(len(flat)) - starts[segment]
+        rolled = np.where(offset <= counts[segment], ROUND, EMPTY)
+        return (
+            np.where(cubes, CUBE, rolled).astype(np.uint8).reshape(array.shape)
+        )
 
     @classmethod
     def north(cls, array):
-        return cls.transpose(cls.tilt(cls.transpose(array)))
+        return cls.tilt(array.T).T
 
     @classmethod
     def west(cls, array):
@@ -52,28 +41,22 @@ class Day14(Day):
 
     @classmethod
     def east(cls, array):
-        return cls.tilt(array, flip=True)
+        return cls.tilt(array[:, ::-1])[:, ::-1]
 
     @classmethod
     def south(cls, array):
-        return cls.transpose(cls.tilt(cls.transpose(array), flip=True))
+        return cls.tilt(array.T[:, ::-1])[:, ::-1].T
 
     @classmethod
     def weight(cls, array):
-        T = cls.transpose(array)
-        ans = 0
-        for row in T:
-            ans += sum([len(row) - i for i, x in enumerate(row) if x == "O"])
-
-        return ans
+        # the border row at the bottom weighs 0, the top row the height
+        rows, _ = (array == ROUND).nonzero()
+        return int((len(array) - 1 - rows).sum())
 
     @classmethod
     def cycle(cls, array):
         output = cls.east(cls.south(cls.west(cls.north(array))))
-        h = str(hash(output))
-        w = cls.weight(output)
-
-        return output, sha1(h.encode("utf-8")).hexdigest(), w
+        return output, output.tobytes(), cls.weight(output)
 
     def part_1(self):
         return self.weight(self.north(self.data))
@@ -35,9 +35,15 @@ class Day15(Day):
                 continue
         return boxes
 
+    @property
+    def steps(self):
+        if self.streaming:
+            return filter(None, (x.strip() for x in self.iter_split(",")))
+        return self.data
+
     def part_1(self):
         ans = 0
-        for d in self.data:
+        for d in self.steps:
             ans += hash(d)
         return ans
 
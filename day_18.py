@@ -80,7 +80,7 @@ class Day18(Day):
     def part_2(self):
         return (
             self.area(self.polygon(part_2=True))
-            + int(sum([x[2][1] for x in d.data]) / 2)
+            + int(sum([x[2][1] for x in self.data]) / 2)
             + 1
         )
 
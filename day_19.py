@@ -92,13 +92,7 @@ class Workflow(object):
 class Day19(Day):
     @cached_property
     def data(self):
-        output = [[], []]
-        i = 0
-        for line in self.raw_data:
-            if line == "":
-                i += 1
-            else:
-                output[i].append(line)
+        output = list(self.iter_records())
 
         parts = []
         for p in output[1]:
@@ -1,7 +1,10 @@
+import re
 from enum import Enum
-from functools import reduce
+from functools import cached_property
 
-from src import Day
+from src import Day, lazy_import
+
+np = lazy_import("numpy")
 
 
 class RGB(Enum):
@@ -9,120 +12,110 @@ class RGB(Enum):
     GREEN = (1, "green")
     BLUE = (2, "blue")
 
-    @property
-    def color(self) -> str:
-        """Get the color string."""
-        return self.value[1]
 
-    @property
-    def index(self) -> int:
-        """Get the index."""
-        return str(self.value[0])
+# the index of each color in the rows of maxima
+COLORS = {color: index for index, color in (rgb.value for rgb in RGB)}
+CUBES = re.compile(r"(\d+) (red|green|blue)")
 
 
 class Day2(Day):
     """Class representing Day 2 of the Advent of Code challenge."""
 
-    @property
-    def data(self) -> dict:
-        """Process the raw data and return a dictionary of game data.
+    # the bag and game comparisons made at once, at most, which bounds the
+    # temporary arrays whatever the number of games
+    BUDGET = 1 << 22
+
+    @cached_property
+    def data(self) -> tuple["np.ndarray", "np.ndarray"]:
+        """Parse the games once into their numbers and color maxima.
+
+        The lines are streamed when in streaming mode, as only the three
+        maxima of each game are kept.
 
         Returns:
-            dict: A dictionary containing game data.
-                  The keys are game numbers and the values are 3D
-                  lists representing the moves made in each game.
+            tuple[np.ndarray, np.ndarray]: The game numbers, and the most
+                cubes of each color shown at once in each game, as a
+                (games, 3) array in the order of RGB.
         """
-        games = {}
-        for line in self.raw_data:
-            line = (
-                line.replace(RGB.RED.color, RGB.RED.index)
-                .replace(RGB.GREEN.color, RGB.GREEN.index)
-                .replace(RGB.BLUE.color, RGB.BLUE.index)
-            )
-            game, sets = line.split(":")
-            game = int(game.strip().replace("Game ", ""))
-            sets = sets.split(";")
-            game_data = [[0] * len(sets) for _ in range(3)]
-            for i, s in enumerate(sets):
-                moves = [
-                    tuple(move.strip().split(" "))
-                    for move in s.strip().split(",")
-                ]
-                for move in moves:
-                    game_data[int(move[1])][i] += int(move[0])
-            games[game] = game_data
-        return games
+        numbers, maxima = [], []
+        for line in self.lines:
+            number, game = self._parse_game(line)
+            numbers.append(number)
+            maxima.append(game)
+        return (
+            np.array(numbers, dtype=np.int64),
+            np.array(maxima, dtype=np.int64).reshape(-1, len(RGB)),
+        )
 
     @staticmethod
-    def _check_moves(draws: list[int], maximum: int) -> bool:
-        """Check if the draws in a game are within the maximum limits.
+    def _parse_game(line: str) -> tuple[int, list[int]]:
+        """Parse a single line of the input into a game.
 
         Args:
-            draws (list[int]): The draws made in a game.
-            maximum (int): The maximum limit for a draw.
+            line (str): The line describing the game.
 
         Returns:
-            bool: True if all draws are within the maximum limit, False
-            otherwise.
+            tuple[int, list[int]]: The game number and the most cubes of
+                each color shown in a single set.
         """
-        return not any(draw > maximum for draw in draws)
-
-    def _check_games(self, maximum: list[int, int, int]) -> dict:
-        """Check the games and return a dictionary of valid games.
+        game, sets = line.split(":")
+        maxima = [0] * len(RGB)
+        for s in sets.split(";"):
+            counts = [0] * len(RGB)
+            for count, color in CUBES.findall(s):
+                counts[COLORS[color]] += int(count)
+            maxima = list(map(max, maxima, counts))
+        return int(game.removeprefix("Game ")), maxima
+
+    def possible(self, bags: "np.typing.ArrayLike") -> "np.ndarray":
+        """Sum the numbers of the games possible with each of many bags.
+
+        A game is possible when none of its sets shows more cubes of a
+        color than the bag holds, so only the maxima of the games need to
+        be compared with the bags, one color at a time per block of bags.
 
         Args:
-            maximum (list[int, int, int]): The maximum limits for each draw.
+            bags (np.typing.ArrayLike): The cubes of each color in every
+                bag, as (bags, 3) in the order of RGB.
 
         Returns:
-            dict: A dictionary containing valid games.
-                  The keys are game numbers and the values is a list with a
-                  list for each cube color representing the moves made in each
-                  game for that color.
+            np.ndarray: The sum of the possible game numbers for each bag.
         """
-        return dict(
-            filter(
-                lambda item: all(
-                    [self._check_moves(x, y) for x, y in zip(item[1], maximum)]
-                ),
-                self.data.items(),
-            )
-        )
-
-    def part_1(self, maximum: list[int, int, int]) -> int:
+        numbers, maxima = self.data
+        bags = np.asarray(bags, dtype=np.int64).reshape(-1, len(RGB))
+        sums = np.empty(len(bags), dtype=np.int64)
+        size = max(1, self.BUDGET // max(1, len(maxima)))
+        for i in range(0, len(bags), size):
+            block = bags[i : i + size]
+            possible = maxima[None, :, 0] <= block[:, None, 0]
+            for color in range(1, len(RGB)):
+                possible &= maxima[None, :, color] <= block[:, None, color]
+            sums[i : i + size] = possible @ numbers
+        return sums
+
+    def part_1(self, maximum: list[int, int, int] = (12, 13, 14)) -> int:
         """Calculate the sum of game numbers for valid games.
 
         Args:
-            maximum (list[int, int, int]): The maximum limits for each draw.
+            maximum (list[int, int, int]): The maximum limits for each draw,
+                defaults to the bag of the puzzle.
 
         Returns:
             int: The sum of game numbers for valid games.
         """
-        return sum(self._check_games(maximum).keys())
-
-    def _mvg(self, game: list[list[int]]) -> list[int]:
-        """Calculate the Minimum Viable Game (MVG)
-        Calculates the minimum cubes needed for each color to
-          have a valid game.
-        Args:
-            game (list[list[int]]): The moves made in a game.
-
-        Returns:
-            list[int]: The minimum cubes needed to have a valid game.
-        """
-        return [max(x) for x in game]
+        return int(self.possible([maximum])[0])
 
     def part_2(self) -> int:
         """Calculates the sum of MVG products for all games.
 
+        The Minimum Viable Game of a game is the fewest cubes of each color
+        it can be played with, which are the maxima of the game.
+
         Returns:
-            int: The product of the maximum draws in each game.
+            int: The sum of the products of the maxima of each game.
         """
-        return sum(
-            [
-                reduce(lambda x, y: x * y, self._mvg(sets))
-                for _, sets in self.data.items()
-            ]
-        )
+        _, maxima = self.data
+        return int(maxima.prod(axis=1).sum())
 
 
 if __name__ == "__main__":
@@ -1,201 +1,127 @@
 from __future__ import annotations
-from src import Day
-from enum import Enum
-from collections import defaultdict, deque
-import pprint
+from src import Day, Graph, Interner, persistent_property
+from collections import deque
+from itertools import count
+from typing import Container
 import math
 
+BUTTON, TEST, BROADCASTER, FLIPFLOP, CONJUNCTION = range(5)
+KINDS = {"%": FLIPFLOP, "&": CONJUNCTION}
+LOW, HIGH = 0, 1
 
-class Pulse(Enum):
-    def __repr__(self) -> str:
-        return self.name.lower()
 
-    def __str__(self) -> str:
-        return self.name.lower()
-
-    LOW = 0
-    HIGH = 1
+class Network(object):
+    """
+    The modules as integer ids, with the wires between them as a graph.
 
+    Module 0 is the button. Conjunctions remember the last pulse of every
+    input wire in a slot of their memory, numbered in order of the wires.
+    """
 
-class Network(object):
     def __init__(self, input: list[str]) -> None:
-        modules = defaultdict(dict)
+        self.names = Interner(["button"])
+        kinds = {"button": BUTTON}
+        wires = [(0, self.names("broadcaster"))]
         for line in input:
             mod, outputs = line.split("->")
             mod = mod.strip()
-            if mod[0] == "%":
-                name = mod[1:]
-                modules[name]["type"] = "flipflop"
-            elif mod[0] == "&":
-                name = mod[1:]
-                modules[name]["type"] = "conjunction"
-            elif mod == "broadcaster":
-                name = mod
-                modules[name]["type"] = "broadcaster"
-            else:
-                name = mod
-                modules[name]["type"] = "other"
-
-            modules[name]["outputs"] = [x.strip() for x in outputs.split(",")]
-
-        outputs = []
-        inputs = []
-        for k, v in modules.items():
-            inputs.append(k)
-            outputs.extend(v["outputs"])
-
-        test_modules = [x for x in outputs if x not in inputs]
-        for mod in test_modules:
-            modules[mod]["type"] = "test"
-            modules[mod]["outputs"] = []
-
-        for mod in modules:
-            modules[mod]["inputs"] = [
-                k for k, v in modules.items() if mod in v["outputs"]
-            ]
-
-        self._modules = modules
+            name = mod.lstrip("%&")
+            kinds[name] = KINDS.get(mod[0], BROADCASTER)
+            for output in outputs.split(","):
+                wires.append((self.names(name), self.names(output.strip())))
+
+        # modules without outputs of their own are test modules
+        self.kinds = [kinds.get(name, TEST) for name in self.names.names]
+        self.outputs = Graph.from_edges(len(self.names), wires)
+        self.inputs = self.outputs.reverse()
+
+        self.slots = []
+        fan_in = [0] * len(self.names)
+        for v in self.outputs.indices:
+            self.slots.append(fan_in[v])
+            fan_in[v] += 1
+        self.fan_in = fan_in
         self.reset()
 
     def reset(self):
-        self._network = self._generate_network()
-
-    @property
-    def inputs(self):
-        return {k: v["inputs"] for k, v in self._modules.items()}
-
-    def _generate_network(self):
-        network: dict[str, Module] = {}
-        for k, v in self._modules.items():
-            match v["type"]:
-                case "flipflop":
-                    network[k] = FlipFlop(k, v["outputs"])
-                case "conjunction":
-                    network[k] = Conjunction(k, v["outputs"], v["inputs"])
-                case "broadcaster":
-                    network[k] = Broadcaster(k, v["outputs"])
-                case "test":
-                    network[k] = Test(k, v["outputs"])
-        return network
-
-    def __getitem__(self, key) -> Module:
-        return self._network[key]
-
-    def __contains__(self, key) -> bool:
-        return key in self._network
-
-    def __repr__(self) -> str:
-        return pprint.pformat(self._network)
-
-
-class Module(object):
-    def __init__(self, name, outputs) -> None:
-        self.name = name
-        self.outputs = outputs
-
-    def ping(self, pulse: Pulse, source: Module = None):
-        raise NotImplementedError
-
-    def __repr__(self) -> str:
-        return (
-            f"{self.name}, {self.__class__.__name__}"
-            f", out: {tuple(self.outputs)}"
-        )
-
-
-class Test(Module):
-    def __init__(self, name, outputs) -> None:
-        super().__init__(name, outputs)
-
-    def ping(self, pulse: Pulse, source: Module = None):
-        return
-
-
-class Broadcaster(Module):
-    def __init__(self, name, outputs) -> None:
-        super().__init__(name, outputs)
-
-    def ping(self, pulse: Pulse, source: Module = None):
-        return [(x, pulse) for x in self.outputs]
-
-
-class Conjunction(Module):
-    def __init__(self, name, outputs, inputs) -> None:
-        super().__init__(name, outputs)
-        self.state = {x: Pulse.LOW for x in inputs}
-
-    def ping(self, pulse: Pulse, source: Module):
-        if source not in self.state:
-            raise ValueError("unrecognized input")
-        else:
-            self.state[source] = pulse
-        if all([x == Pulse.HIGH for x in self.state.values()]):
-            p = Pulse.LOW
-        else:
-            p = Pulse.HIGH
-
-        return [(x, p) for x in self.outputs]
-
-    def __repr__(self) -> str:
-        return super().__repr__() + f", in: {tuple(self.state.keys())}"
-
-
-class FlipFlop(Module):
-    def __init__(self, name, outputs) -> None:
-        super().__init__(name, outputs)
-        self.state = False
-
-    def ping(self, pulse: Pulse, source: Module = None):
-        if pulse == Pulse.HIGH:
-            return
-
-        if self.state:
-            self.state = False
-            return [(x, Pulse.LOW) for x in self.outputs]
-        else:
-            self.state = True
-            return [(x, Pulse.HIGH) for x in self.outputs]
+        self.flipflops = [False] * len(self.kinds)
+        self.memory = [[LOW] * n for n in self.fan_in]
+        # the number of inputs each conjunction remembers as high
+        self.highs = [0] * len(self.kinds)
+
+    def press(self, watch: Container[int] = ()) -> tuple[int, int, set[int]]:
+        """
+        Push the button and pass on the pulses until they die out.
+
+        Args:
+            watch (Container[int]): The modules to watch for high pulses.
+
+        Returns:
+            tuple[int, int, set[int]]: The number of low and high pulses,
+                and the watched modules that sent a high pulse.
+        """
+        indptr, indices = self.outputs.indptr, self.outputs.indices
+        kinds, slots, fan_in = self.kinds, self.slots, self.fan_in
+        flipflops, memory, highs = self.flipflops, self.memory, self.highs
+
+        counts = [0, 0]
+        fired = set()
+        queue = deque([(0, LOW)])
+        while queue:
+            u, pulse = queue.popleft()
+            counts[pulse] += indptr[u + 1] - indptr[u]
+            if pulse == HIGH and u in watch:
+                fired.add(u)
+
+            for e in range(indptr[u], indptr[u + 1]):
+                v = indices[e]
+                kind = kinds[v]
+                if kind == FLIPFLOP:
+                    if pulse == LOW:
+                        flipflops[v] = not flipflops[v]
+                        queue.append((v, int(flipflops[v])))
+                elif kind == CONJUNCTION:
+                    highs[v] += pulse - memory[v][slots[e]]
+                    memory[v][slots[e]] = pulse
+                    queue.append((v, int(highs[v] != fan_in[v])))
+                elif kind == BROADCASTER:
+                    queue.append((v, pulse))
+
+        return counts[LOW], counts[HIGH], fired
 
 
 class Day20(Day):
-    def __init__(self, input_file_path: str) -> None:
-        super().__init__(input_file_path)
-        self.network = Network(self.raw_data)
+    @persistent_property(version=2)
+    def network(self) -> Network:
+        return Network(self.raw_data)
+
+    def parse(self) -> None:
+        self.network
 
     def part1(self):
         self.network.reset()
-        counts = {Pulse.LOW: 0, Pulse.HIGH: 0}
+        low = high = 0
         for _ in range(1000):
-            queue = deque([("broadcaster", Pulse.LOW, "button")])
+            lows, highs, _ = self.network.press()
+            low, high = low + lows, high + highs
 
-            while queue:
-                node, pulse, source = queue.popleft()
-                counts[pulse] += 1
-                output = self.network[node].ping(pulse, source=source)
-                if output:
-                    queue.extend([(*x, node) for x in output])
-
-        return counts[Pulse.HIGH] * counts[Pulse.LOW]
+        return low * high
 
     def part2(self):
-        self.network.reset()
-        buttonpresses = 0
+        network = self.network
+        network.reset()
+        # rx is fed by a single conjunction, which sends it a low pulse once
+        # all of its inputs sent a high one; they do so on separate cycles
+        (feed,) = network.inputs.neighbours(network.names.ids["rx"])
+        inputs = set(network.inputs.neighbours(feed))
         counts = {}
-        while True:
-            buttonpresses += 1
-            queue = deque([("broadcaster", Pulse.LOW, "button")])
-
-            while queue:
-                node, pulse, source = queue.popleft()
-                if pulse == Pulse.HIGH and source in self.network["hp"].state:
-                    counts[source] = buttonpresses
-
-                if counts.keys() == self.network["hp"].state.keys():
-                    return math.prod(counts.values())
+        for buttonpresses in count(1):
+            _, _, fired = network.press(inputs)
+            for source in fired:
+                counts[source] = buttonpresses
 
-                output = self.network[node].ping(pulse, source=source)
-                if output:
-                    queue.extend([(*x, node) for x in output])
+            if counts.keys() == inputs:
+                return math.prod(counts.values())
 
 
 if __name__ == "__main__":
@@ -1,15 +1,13 @@
-from src import Day
+from src import Day, persistent_property
+from src.parse import integers
 from functools import cached_property
 from collections import deque
 
 
 class Brick(object):
-    def __init__(self, definition: str) -> None:
-        self._definition = definition
-        s, e = [
-            tuple([int(x) for x in y.split(",")])
-            for y in definition.split("~")
-        ]
+    def __init__(self, definition: tuple[int, ...]) -> None:
+        self._definition = tuple(definition)
+        s, e = self._definition[:3], self._definition[3:]
         self.x = range(s[0], e[0] + 1)
         self.y = range(s[1], e[1] + 1)
         self.z = range(s[2], e[2] + 1)
@@ -48,10 +46,11 @@ class Brick(object):
 
 
 class Day22(Day):
-    def __init__(self, input_file: str) -> None:
-        super().__init__(input_file)
-        bricks = [Brick(line) for line in self.raw_data]
-        self.bricks = sorted(bricks, key=lambda b: b.z.stop)
+    @persistent_property(version=2)
+    def bricks(self) -> list[Brick]:
+        corners = integers(self.buffer, columns=6).tolist()
+        bricks = [Brick(row) for row in corners]
+        return sorted(bricks, key=lambda b: b.z.stop)
 
     @cached_property
     def supported_by(self) -> dict["Brick", list["Brick"]]:
@@ -71,13 +70,16 @@ class Day22(Day):
 
         return supported_by
 
+    def parse(self) -> None:
+        self.bricks
+
     def part_1(self):
         criticalsupports = set()
         for v in self.supported_by.values():
             if len(v) == 1:
                 criticalsupports.add(v[0])
 
-        return len(set(d.bricks) - criticalsupports)
+        return len(set(self.bricks) - criticalsupports)
 
     def part_2(self):
         score = {}
@@ -1,6 +1,10 @@
-from src import Day
+from src import Day, Graph, Grid, Interner, lazy_import
 from functools import cached_property
 
+np = lazy_import("numpy")
+
+FOREST = ord("#")
+
 
 class Day23(Day):
     DIRS = {
@@ -12,92 +16,125 @@ class Day23(Day):
     }
 
     @cached_property
-    def data(self):
-        return self.raw_data
-
-    @cached_property
-    def width(self):
-        return len(self.data[0])
-
-    @cached_property
-    def height(self):
-        return len(self.data)
+    def grid(self) -> Grid:
+        return Grid(self.raw_data, fill="#")
 
     @cached_property
     def start(self):
-        return (0, self.data[0].index("."))
+        return self.grid.index(0, self.raw_data[0].index("."))
 
     @cached_property
     def end(self):
-        return (len(self.data) - 1, self.data[-1].index("."))
+        return self.grid.index(
+            self.grid.height - 1, self.raw_data[-1].index(".")
+        )
 
-    def calculate_graph(self, allowed_directions=DIRS):
-        nodes = [self.start, self.end]
-        for r, row in enumerate(self.data):
-            for c, ch in enumerate(row):
-                if ch == "#":
-                    continue
-                neighbours = 0
-                for nr, nc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                    if (
-                        0 <= r + nr < self.height
-                        and 0 <= c + nc < self.width
-                        and self.data[r + nr][c + nc] != "#"
-                    ):
-                        neighbours += 1
-                if neighbours >= 3:
-                    nodes.append((r, c))
-
-        graph = {node: {} for node in nodes}
-
-        for node in nodes:
+    @cached_property
+    def junctions(self) -> list[int]:
+        """
+        The flat indices of the paths with three or more neighbouring paths.
+
+        Returns:
+            list[int]: The junctions, in row-major order.
+        """
+        path = self.grid.array != FOREST
+        neighbours = np.zeros(path.shape, dtype=np.int8)
+        neighbours[1:-1, 1:-1] = (
+            path[:-2, 1:-1].astype(np.int8)
+            + path[2:, 1:-1]
+            + path[1:-1, :-2]
+            + path[1:-1, 2:]
+        )
+        return np.flatnonzero(path & (neighbours >= 3)).tolist()
+
+    def calculate_graph(self, allowed_directions=DIRS) -> Graph:
+        """
+        Compress the map into the paths between junctions.
+
+        Node 0 is the start, node 1 the end and the others the junctions,
+        with edges weighted by the length of the path between them.
+
+        Args:
+            allowed_directions (dict): The steps allowed from each tile.
+
+        Returns:
+            Graph: The weighted graph of junctions.
+        """
+        stride = self.grid.stride
+        steps = {
+            ord(ch): [dr * stride + dc for dr, dc in directions]
+            for ch, directions in allowed_directions.items()
+        }
+        cells = self.grid.bytes
+        nodes = Interner([self.start, self.end, *self.junctions])
+
+        edges = []
+        for node in nodes.names:
             stack = [(node, 0)]
             seen = set([node])
 
             while stack:
-                (r, c), n = stack.pop()
+                i, n = stack.pop()
 
-                if (r, c) in nodes and (r, c) != node:
-                    graph[node][(r, c)] = n
+                if i in nodes and i != node:
+                    edges.append((nodes.ids[node], nodes.ids[i], n))
                     continue
 
-                for dr, dc in allowed_directions[self.data[r][c]]:
-                    nr, nc = r + dr, c + dc
-                    if (
-                        0 <= nr < self.height
-                        and 0 <= nc < self.width
-                        and self.data[nr][nc] != "#"
-                        and (nr, nc) not in seen
-                    ):
-                        stack.append(((nr, nc), n + 1))
-                        seen.add((nr, nc))
-
-        return graph
-
-    def DFS(self, graph, node: tuple[int, int] = None, visited: set = set()):
-        if not node:
-            node = self.start
-
-        if node == self.end:
-            return 0
-
-        m = -float("inf")
-        visited.add(node)
-
-        for neighbor in graph[node]:
-            if neighbor not in visited:
-                m = max(
-                    m,
-                    self.DFS(graph, neighbor, visited) + graph[node][neighbor],
-                )
-
-        visited.remove(node)
-
-        return m
+                for step in steps[cells[i]]:
+                    if cells[i + step] != FOREST and i + step not in seen:
+                        stack.append((i + step, n + 1))
+                        seen.add(i + step)
+
+        return Graph.from_edges(len(nodes), edges)
+
+    @staticmethod
+    def longest_path(graph: Graph, start: int = 0, end: int = 1) -> int:
+        """
+        Find the longest path between two nodes that visits no node twice.
+
+        Searches every path depth first, with the nodes on the current path
+        as a bitmask.
+
+        Args:
+            graph (Graph): The weighted graph of junctions.
+            start (int): The node to start from.
+            end (int): The node to end at.
+
+        Returns:
+            int: The length of the longest path, -inf if there is none.
+        """
+        indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+        adjacency = [
+            [
+                (indices[e], 1 << indices[e], weights[e])
+                for e in range(indptr[u], indptr[u + 1])
+            ]
+            for u in range(len(graph))
+        ]
+        # a path into the only node leading to the end has to go there next
+        last = graph.reverse().neighbours(end)
+        if len(last) == 1:
+            (last,) = last
+            adjacency[last] = [e for e in adjacency[last] if e[0] == end]
+
+        longest = -float("inf")
+        stack = [(start, 1 << start, 0)]
+        while stack:
+            node, visited, length = stack.pop()
+            if node == end:
+                longest = max(longest, length)
+                continue
+            for neighbour, bit, weight in adjacency[node]:
+                if not visited & bit:
+                    stack.append((neighbour, visited | bit, length + weight))
+
+        return longest
+
+    def parse(self) -> None:
+        self.grid
 
     def part1(self) -> int:
-        graph = self.calculate_graph()
-        return self.DFS(graph)
+        return self.longest_path(self.calculate_graph())
 
     def part2(self) -> int:
         newdirs = {
@@ -107,8 +144,7 @@ class Day23(Day):
             "v": [(0, -1), (0, 1), (-1, 0), (1, 0)],
             ".": [(0, -1), (0, 1), (-1, 0), (1, 0)],
         }
-        graph = self.calculate_graph(newdirs)
-        return self.DFS(graph)
+        return self.longest_path(self.calculate_graph(newdirs))
 
 
 if __name__ == "__main__":
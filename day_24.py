@@ -1,24 +1,20 @@
-from src import Day
-import sympy
+from src import Day, lazy_import, persistent_property
+from src.parse import integers
+
+sympy = lazy_import("sympy")
 
 
 class Hailstone:
-    def __init__(self, definition):
-        self._definition = definition
-        loc, v = definition.split("@")
-        self.x, self.y, self.z = tuple(
-            [int(x.strip()) for x in loc.split(",")]
-        )
-        self.vx, self.vy, self.vz = tuple(
-            [int(x.strip()) for x in v.split(",")]
-        )
+    def __init__(self, definition: list[int]):
+        self._definition = tuple(definition)
+        self.x, self.y, self.z, self.vx, self.vy, self.vz = definition
 
         self.a = self.vy
         self.b = -self.vx
         self.c = self.vy * self.x - self.vx * self.y
 
     def __repr__(self):
-        return f"Hailstone({self._definition})"
+        return "Hailstone({}, {}, {} @ {}, {}, {})".format(*self._definition)
 
     def intersects(
         self,
@@ -46,9 +42,14 @@ class Hailstone:
 
 
 class Day24(Day):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.hailstones = [Hailstone(h) for h in self.raw_data]
+    @persistent_property(version=2)
+    def hailstones(self) -> list[Hailstone]:
+        # Python ints, as the line equations overflow int64
+        definitions = integers(self.buffer, columns=6).tolist()
+        return [Hailstone(h) for h in definitions]
+
+    def parse(self) -> None:
+        self.hailstones
 
     def part_1(self):
         ans = 0
@@ -1,22 +1,34 @@
-from src import Day
-import networkx as nx
+from src import Day, Graph, Interner
+from functools import cached_property
+
+CUT = 3
 
 
 class Day25(Day):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        graph = nx.Graph()
+    @cached_property
+    def graph(self) -> Graph:
+        names = Interner()
+        edges = []
         for line in self.raw_data:
             s, ds = line.split(":")
             for node in ds.strip().split(" "):
-                graph.add_edge(s, node)
-        self.graph = graph
+                edges.append((names(s), names(node)))
+        return Graph.from_edges(len(names), edges, directed=False)
+
+    def parse(self) -> None:
+        self.graph
 
     def part_1(self):
-        self.graph.remove_edges_from(nx.minimum_edge_cut(self.graph))
-        a, b = nx.connected_components(self.graph)
+        # nodes far from the source are likely on the other side of the cut
+        distance = self.graph.bfs(0)
+        sinks = sorted(range(1, len(distance)), key=lambda u: -distance[u])
+        for sink in sinks:
+            cut, side = self.graph.min_cut(0, sink, limit=CUT)
+            if cut == CUT:
+                a = sum(side)
+                return a * (len(side) - a)
 
-        return len(a) * len(b)
+        raise ValueError(f"the graph has no cut of {CUT} edges")
 
 
 if __name__ == "__main__":
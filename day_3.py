@@ -1,42 +1,107 @@
-from src import Day
+from functools import cached_property
+from math import prod
+from typing import Iterator
+
+from src import Day, Grid, lazy_import
+
+np = lazy_import("numpy")
+
+
+class Day3(Day):
+    @cached_property
+    def grid(self) -> Grid:
+        return Grid(self.raw_data, fill=".")
+
+    @cached_property
+    def numbers(self) -> tuple["np.ndarray", list[int]]:
+        """
+        Label the runs of digits in one pass over the cells.
+
+        Returns:
+            tuple[np.ndarray, list[int]]: The number covering every flat
+                cell, -1 for cells that are not digits, and the value of
+                every number.
+        """
+        grid = self.grid
+        digits = (grid.flat >= ord("0")) & (grid.flat <= ord("9"))
+        # the border is ".", so numbers never run across rows
+        edges = np.diff(digits.astype(np.int8), prepend=0)
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+
+        labels = np.cumsum(edges == 1) - 1
+        labels[~digits] = -1
+        values = [
+            int(grid.bytes[start:end])
+            for start, end in zip(starts.tolist(), ends.tolist())
+        ]
+        return labels, values
+
+    @cached_property
+    def index(self) -> dict[int, list[int]]:
+        """
+        Index the numbers adjacent to every symbol.
+
+        The eight neighbours of all symbols are looked up at once in the
+        labels, so the index takes time linear in the cells.
+
+        Returns:
+            dict[int, list[int]]: The numbers next to each symbol, in
+                reading order, keyed by the flat cell of the symbol.
+        """
+        grid = self.grid
+        labels, _ = self.numbers
+        digits = labels >= 0
+        symbols = np.flatnonzero(~digits & (grid.flat != ord(".")))
+
+        s = grid.stride
+        window = np.array((-s - 1, -s, -s + 1, -1, 1, s - 1, s, s + 1))
+        adjacent = labels[symbols[:, None] + window]
+        symbol = np.broadcast_to(symbols[:, None], adjacent.shape)
+        found = adjacent >= 0
+        # a number next to a symbol in several cells counts once
+        pairs = np.unique(
+            np.stack((symbol[found], adjacent[found]), axis=1), axis=0
+        )
+
+        index = {symbol: [] for symbol in symbols.tolist()}
+        for symbol, number in pairs.tolist():
+            index[symbol].append(number)
+        return index
+
+    def gears(self, arity: int | None = 2, symbol: str = "*") -> Iterator[int]:
+        """
+        Find the gear ratios, the products of the numbers next to a gear.
+
+        Args:
+            arity (int | None): The number of adjacent numbers that makes a
+                symbol a gear, or None for any number from two up.
+            symbol (str): The symbol of the gears.
+
+        Yields:
+            int: The ratio of each gear.
+        """
+        grid = self.grid
+        _, values = self.numbers
+        for cell, numbers in self.index.items():
+            if grid.bytes[cell] != ord(symbol):
+                continue
+            if len(numbers) == arity or (arity is None and len(numbers) > 1):
+                yield prod(values[number] for number in numbers)
+
+    def parse(self) -> None:
+        self.grid
+
+    def part_1(self):
+        _, values = self.numbers
+        parts = set().union(*self.index.values())
+        return sum(values[number] for number in parts)
+
+    def part_2(self, arity: int | None = 2):
+        return sum(self.gears(arity))
+
 
 if __name__ == "__main__":
-    d3 = Day("./input/day_3.txt")
-
-    w = len(d3.data[0])
-    h = len(d3.data)
-
-    part = ["", None]
-    parts = []
-    ispart = False
-
-    for r, line in enumerate(d3.data):
-        for c, char in enumerate(line):
-            if not char.isdigit():
-                if part[0] != "" and ispart:
-                    part[0] = int(part[0])
-                    parts.append(part)
-                part = ["", None]
-                ispart = False
-            elif char.isdigit():
-                part[0] += char
-
-                for ln in range(max(0, r - 1), min(h, r + 2)):
-                    for x in range(max(0, c - 1), min(w, c + 2)):
-                        if (
-                            not d3.data[ln][x].isnumeric()
-                            and d3.data[ln][x] != "."
-                        ):
-                            ispart = True
-                            part[1] = (ln, x, d3.data[ln][x])
-
-    stars = [x[1] for x in parts if x[1][2] == "*"]
-    stars = set([star for star in stars if stars.count(star) == 2])
-
-    gr = 0
-    for star in stars:
-        gears = list(filter(lambda x: x[1] == star, parts))
-        gr += gears[0][0] * gears[1][0]
-
-    print(f"Part 1: {sum([x[0] for x in parts])}")
-    print(f"Part 2: {gr}")
+    d = Day3("./input/day_3.txt")
+    print(f"Part 1: {d.part_1()}")
+    print(f"Part 2: {d.part_2()}")
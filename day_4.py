@@ -1,43 +1,102 @@
+import re
 from collections import defaultdict
 from functools import cached_property
+from typing import Iterable
 
-from src import Day
+from src import Day, lazy_import
+from src.parse import integers, rows
+
+np = lazy_import("numpy")
 
 
 class Day4(Day):
     @cached_property
     def data(self):
-        data = defaultdict()
+        """
+        Parse the cards into a matrix, one row per card.
+
+        Returns:
+            np.ndarray: The card number, the winning numbers and the
+                numbers of every card.
+        """
+        return rows(self.buffer)
+
+    @cached_property
+    def winning(self):
+        # the card number and winning numbers come before the bar, which
+        # is matched on the loaded buffer rather than reading the file again
+        head = re.match(rb"[^|\n]*", self.buffer).group()
+        return len(integers(head)) - 1
+
+    @staticmethod
+    def bitsets(numbers):
+        """
+        Pack the non-negative numbers of every row into a bitset.
 
-        for line in self.raw_data:
-            c, line = line.split(":")
-            card = int(c.split()[-1])
-            nums, wins = line.split("|")
-            nums = [int(n.strip()) for n in nums.split()]
-            wins = [int(w.strip()) for w in wins.split()]
+        Args:
+            numbers (np.ndarray): The numbers, one row per set.
 
-            data[card] = list(set(nums) & set(wins))
+        Returns:
+            np.ndarray: Bit n of each row is set if the row holds n, in
+                64-bit words, as (rows, words).
+        """
+        words = int(numbers.max(initial=0)) // 64 + 1
+        # one row per column, as numpy reduces fastest over the first axis
+        numbers = np.ascontiguousarray(numbers.T)
+        bits = np.uint64(1) << (numbers & 63).astype(np.uint64)
+        sets = np.empty((words, numbers.shape[1]), dtype=np.uint64)
+        for word in range(words):
+            in_word = np.where(numbers >> 6 == word, bits, np.uint64(0))
+            np.bitwise_or.reduce(in_word, axis=0, out=sets[word])
+        return sets.T
 
-        return data
+    @cached_property
+    def matches(self):
+        """
+        Count the numbers of every card that are winning numbers.
+
+        Both sides become bitsets over the range of the numbers, so a card
+        takes a few ANDs and a popcount whatever its size.
+
+        Returns:
+            np.ndarray: The number of matches of every card.
+        """
+        data = self.data
+        winning = self.bitsets(data[:, 1 : 1 + self.winning])
+        numbers = self.bitsets(data[:, 1 + self.winning :])
+        common = np.ascontiguousarray(winning & numbers).view(np.uint8)
+        return np.unpackbits(common, axis=1).sum(axis=1, dtype=np.int64)
+
+    @staticmethod
+    def _parse_card(line):
+        c, line = line.split(":")
+        nums, wins = line.split("|")
+        return len(set(nums.split()) & set(wins.split()))
+
+    def _matches(self) -> Iterable[int]:
+        if self.streaming:
+            return map(self._parse_card, self.lines)
+        return self.matches.tolist()
 
     def part_1(self):
-        return sum(
-            [
-                2 ** (len(card) - 1)
-                for _, card in self.data.items()
-                if len(card) > 0
-            ]
-        )
+        if self.streaming:
+            return sum(1 << m >> 1 for m in self._matches())
+        return int((np.left_shift(1, self.matches) >> 1).sum())
 
     def part_2(self):
-        copies = defaultdict(int)
-        for card, wins in self.data.items():
-            copies[card] += 1
-            for j in range(len(wins)):
-                if card + j + 1 in self.data:
-                    copies[card + j + 1] += copies[card]
-
-        return sum(copies.values())
+        # a card with m matches adds its copies to the next m cards, kept
+        # as a difference array and summed up while going through them
+        total = running = 0
+        changes = defaultdict(int)
+        for i, matches in enumerate(self._matches()):
+            running += changes.pop(i, 0)
+            copies = 1 + running
+            total += copies
+            if matches:
+                changes[i + 1] += copies
+                changes[i + 1 + matches] -= copies
+
+        return total
 
 
 if __name__ == "__main__":
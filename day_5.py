@@ -1,4 +1,169 @@
-from src import Day
+import re
+from bisect import bisect_right
+from functools import cached_property, reduce
+from typing import Iterable
+
+from src import Day, lazy_import
+from src.parse import integers
+
+np = lazy_import("numpy")
+
+
+class PiecewiseMap:
+    """
+    A map of the non-negative integers that shifts each of a sorted set of
+    ranges by its own offset.
+
+    The values from breaks[i] up to breaks[i + 1], or up to infinity for
+    the last break, are shifted by offsets[i]. Maps compose into another
+    map of this form, so a chain of stages collapses into a single one.
+    """
+
+    def __init__(self, breaks: list[int], offsets: list[int]) -> None:
+        self.breaks = breaks
+        self.offsets = offsets
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[Iterable[int]]) -> "PiecewiseMap":
+        """
+        Build a map from almanac lines, leaving unmapped values as they are.
+
+        Args:
+            ranges (Iterable[Iterable[int]]): The destination start, the
+                source start and the length of every mapped range.
+
+        Returns:
+            PiecewiseMap: The map.
+        """
+        pieces, end = [(0, 0)], 0
+        for dest, src, size in sorted(ranges, key=lambda r: r[1]):
+            if src < end:
+                raise ValueError(f"overlapping ranges at {src}")
+            pieces.append((src, dest - src))
+            pieces.append((end := src + size, 0))
+        return cls._merge(pieces)
+
+    @classmethod
+    def _merge(cls, pieces: list[tuple[int, int]]) -> "PiecewiseMap":
+        # drop empty pieces, and pieces that continue the previous offset
+        breaks, offsets = [], []
+        for start, offset in pieces:
+            if breaks and start == breaks[-1]:
+                breaks.pop()
+                offsets.pop()
+            if not offsets or offset != offsets[-1]:
+                breaks.append(start)
+                offsets.append(offset)
+        return cls(breaks, offsets)
+
+    def __call__(self, value: int) -> int:
+        return value + self.offsets[bisect_right(self.breaks, value) - 1]
+
+    def __len__(self) -> int:
+        return len(self.breaks)
+
+    def then(self, other: "PiecewiseMap") -> "PiecewiseMap":
+        """
+        Compose the map with another one, applied after it.
+
+        Every piece of this map is split where its image crosses a break
+        of the other map, and the offsets of both are added up.
+
+        Args:
+            other (PiecewiseMap): The map to apply second.
+
+        Returns:
+            PiecewiseMap: The map of other(self(value)).
+        """
+        pieces = []
+        ends = self.breaks[1:] + [None]
+        for start, end, offset in zip(self.breaks, ends, self.offsets):
+            i = bisect_right(other.breaks, start + offset) - 1
+            pieces.append((start, offset + other.offsets[i]))
+            for j in range(i + 1, len(other.breaks)):
+                if end is not None and other.breaks[j] >= end + offset:
+                    break
+                pieces.append(
+                    (other.breaks[j] - offset, offset + other.offsets[j])
+                )
+        return self._merge(pieces)
+
+    def lookup(self, values: "np.typing.ArrayLike") -> "np.ndarray":
+        """
+        Map many values in one vectorised binary search.
+
+        Args:
+            values (np.typing.ArrayLike): The non-negative values.
+
+        Returns:
+            np.ndarray: The mapped values, as int64.
+        """
+        values = np.asarray(values, dtype=np.int64)
+        pieces = np.searchsorted(self.breaks, values, side="right") - 1
+        return values + np.asarray(self.offsets, dtype=np.int64)[pieces]
+
+    def image(self, intervals: "np.typing.ArrayLike") -> "np.ndarray":
+        """
+        Map many ranges of values at once.
+
+        The ranges are sorted and merged, then swept against the pieces:
+        every range is cut at the breaks it spans and each part shifted by
+        the offset of its piece, all in vectorised steps, before the parts
+        are merged again. This takes O((n + m) log(n + m)) for n ranges
+        and m pieces, whatever their overlap.
+
+        Args:
+            intervals (np.typing.ArrayLike): The [start, stop) ranges of
+                non-negative values, as (ranges, 2).
+
+        Returns:
+            np.ndarray: The sorted, disjoint [start, stop) ranges of the
+                mapped values, as (ranges, 2).
+        """
+        starts, stops = coalesce(intervals).T
+        breaks = np.asarray(self.breaks, dtype=np.int64)
+        ends = np.append(breaks[1:], np.iinfo(np.int64).max)
+        offsets = np.asarray(self.offsets, dtype=np.int64)
+
+        first = np.searchsorted(breaks, starts, side="right") - 1
+        last = np.searchsorted(breaks, stops - 1, side="right") - 1
+        # one part for every range and piece it overlaps
+        counts = last - first + 1
+        owner = np.repeat(np.arange(len(starts)), counts)
+        skip = np.repeat(np.cumsum(counts) - counts, counts)
+        piece = first[owner] + np.arange(len(owner)) - skip
+
+        shift = offsets[piece]
+        lo = np.maximum(starts[owner], breaks[piece]) + shift
+        hi = np.minimum(stops[owner], ends[piece]) + shift
+        return coalesce(np.stack((lo, hi), axis=1))
+
+
+def coalesce(intervals: "np.typing.ArrayLike") -> "np.ndarray":
+    """
+    Sort ranges, dropping the empty ones and merging those that overlap or
+    touch.
+
+    Args:
+        intervals (np.typing.ArrayLike): The [start, stop) ranges, as
+            (ranges, 2).
+
+    Returns:
+        np.ndarray: The sorted, disjoint ranges, as (ranges, 2).
+    """
+    intervals = np.asarray(intervals, dtype=np.int64).reshape(-1, 2)
+    intervals = intervals[intervals[:, 0] < intervals[:, 1]]
+    if not len(intervals):
+        return intervals
+    intervals = intervals[np.argsort(intervals[:, 0], kind="stable")]
+    starts, stops = intervals.T
+    reach = np.maximum.accumulate(stops)
+    # a range starts a new group unless an earlier one reaches it
+    new = np.concatenate(([True], starts[1:] > reach[:-1]))
+    groups = np.flatnonzero(new)
+    return np.stack(
+        (starts[groups], np.maximum.reduceat(stops, groups)), axis=1
+    )
 
 
 class Day5(Day):
@@ -7,83 +172,66 @@ class Day5(Day):
     of Code challenge.
     """
 
-    @property
+    @cached_property
+    def sections(self) -> list[bytes]:
+        # split on blank lines, which may end in \r\n
+        return re.split(rb"\r?\n\s*\r?\n", bytes(self.buffer).strip())
+
+    @cached_property
     def seeds(self):
-        return [int(x) for x in self.data[0].split(":")[1].split()]
+        return integers(self.sections[0], signed=False).tolist()
 
-    @property
+    @cached_property
     def blocks(self):
-        blocks = []
-        for line in d.data[2:]:
-            if ":" in line:
-                blocks.append([])
-            else:
-                if v := [int(x) for x in line.split()]:
-                    blocks[-1].append(v)
-        return blocks
+        return [
+            integers(section, columns=3, signed=False).tolist()
+            for section in self.sections[1:]
+        ]
+
+    @cached_property
+    def stages(self) -> list[PiecewiseMap]:
+        return [PiecewiseMap.from_ranges(block) for block in self.blocks]
+
+    @cached_property
+    def almanac(self) -> PiecewiseMap:
+        """
+        The seed to location map, with all stages composed into one.
+
+        Returns:
+            PiecewiseMap: The map.
+        """
+        return reduce(PiecewiseMap.then, self.stages, PiecewiseMap([0], [0]))
+
+    def parse(self) -> None:
+        self.seeds
+        self.blocks
 
     def part_1(self):
-        soils = []
-        for seed in self.seeds:
-            for block in self.blocks:
-                for dest, src, sz in block:
-                    if seed in range(src, src + sz):
-                        seed = dest + (seed - src)
-                        break
-            soils.append(seed)
-        return min(soils)
-
-    def rsolve(
-        self,
-        source_ranges: list[tuple[int, int]],
-        block: list[list[int, int, int]],
-    ) -> list[tuple[int, int]]:
+        return int(self.almanac.lookup(self.seeds).min())
+
+    @cached_property
+    def seed_ranges(self) -> "np.ndarray":
+        seeds = np.array(self.seeds, dtype=np.int64).reshape(-1, 2)
+        return coalesce(np.stack((seeds[:, 0], seeds.sum(axis=1)), axis=1))
+
+    def locations(self, ranges: "np.typing.ArrayLike" = None) -> "np.ndarray":
         """
-        Resolve the destination ranges based on the source ranges and blocks.
+        Map ranges of seeds to the ranges of their locations.
 
         Args:
-            SR: A list of tuples representing the source ranges.
-            block: A list of lists representing the mappings from source
-                to dest for a stage in the seed to soil map.
+            ranges (np.typing.ArrayLike): The [start, stop) ranges of
+                seeds, defaults to those of the almanac.
 
         Returns:
-            A list of tuples representing the destination ranges.
+            np.ndarray: The sorted, disjoint [start, stop) ranges of the
+                locations, as (ranges, 2).
         """
-        # destination ranges
-        dest_ranges = []
-        for dest, src, sz in block:
-            # intermediate ranges
-            inter_ranges = []
-            while source_ranges:
-                start, stop = source_ranges.pop()
-
-                # split intervals
-                pre = (start, min(src, stop))
-                overlap = (max(start, src), min(src + sz, stop))
-                post = (max(src + sz, start), stop)
-
-                if pre[1] > pre[0]:
-                    inter_ranges.append((pre[0], pre[1]))
-                if overlap[1] > overlap[0]:
-                    dest_ranges.append(
-                        (dest + (overlap[0] - src), dest + (overlap[1] - src))
-                    )
-                if post[1] > post[0]:
-                    inter_ranges.append((post[0], post[1]))
-            source_ranges = inter_ranges
-        return dest_ranges + source_ranges
+        if ranges is None:
+            ranges = self.seed_ranges
+        return self.almanac.image(ranges)
 
     def part_2(self):
-        seeds = [tuple(x) for x in zip(self.seeds[::2], self.seeds[1::2])]
-        seeds = [[(start, start + size)] for start, size in seeds]
-        soils = []
-        for seed in seeds:
-            for block in self.blocks:
-                seed = self.rsolve(seed, block)
-
-            soils.append(min(seed, key=lambda x: x[0]))
-
-        return min(soils, key=lambda x: x[0])[0]
+        return int(self.locations()[0, 0])
 
 
 if __name__ == "__main__":
@@ -1,13 +1,21 @@
 import math
 
-from src import Day
+from src import Day, lazy_import
+from src.parse import integers
+
+np = lazy_import("numpy")
+
+# races shorter than this, with records below its square over four, fit
+# their products in int64
+INT64_TIME = 1 << 31
 
 
 class Day6(Day):
     @property
     def data1(self):
-        times = [int(x) for x in self.raw_data[0].split(":")[1].split()]
-        distances = [int(x) for x in self.raw_data[1].split(":")[1].split()]
+        lines = iter(self.lines)
+        times = integers(next(lines)).tolist()
+        distances = integers(next(lines)).tolist()
 
         return times, distances
 
@@ -17,22 +25,76 @@ class Day6(Day):
 
     @staticmethod
     def solve(t, d):
-        sols = sorted(
-            [
-                (-t + (t**2 - 4 * d) ** 0.5) / 2,
-                (-t - (t**2 - 4 * d) ** 0.5) / 2,
-            ]
-        )
+        """
+        Count the ways to beat a record, in exact integer arithmetic.
+
+        Holding the button for h of the t milliseconds travels h * (t - h),
+        which beats d for the h strictly between the roots of
+        h^2 - t h + d. The integer square root gives the lower root up to
+        one, which the loop corrects, and the upper bound is t minus the
+        lower one by symmetry.
+
+        Args:
+            t (int): The time of the race.
+            d (int): The record distance.
+
+        Returns:
+            int: The number of winning hold times.
+        """
+        discriminant = t * t - 4 * d
+        if discriminant < 0:
+            return 0
+        low = max((t - math.isqrt(discriminant)) // 2, 0)
+        while low > 0 and (low - 1) * (t - low + 1) > d:
+            low -= 1
+        while low <= t - low and low * (t - low) <= d:
+            low += 1
+        return max(t - 2 * low + 1, 0)
+
+    @classmethod
+    def solve_many(cls, times, distances):
+        """
+        Count the ways to beat the records of many races at once.
+
+        The lower roots are estimated with a float square root and then
+        corrected in int64, which is exact as long as the products fit.
+        Races that are too long for that are solved one by one with
+        Python ints instead.
+
+        Args:
+            times (np.typing.ArrayLike): The time of every race.
+            distances (np.typing.ArrayLike): The record of every race.
 
-        sols = math.ceil(sols[0]), math.floor(sols[1])
+        Returns:
+            np.ndarray: The number of winning hold times of every race, as
+                int64, or as Python ints for races too long for int64.
+        """
+        t, d = np.asarray(times), np.asarray(distances)
+        if (
+            t.dtype == object
+            or d.dtype == object
+            or t.max(initial=0) >= INT64_TIME
+            or d.max(initial=0) >= INT64_TIME**2 // 4
+        ):
+            return np.array(
+                [cls.solve(int(t), int(d)) for t, d in zip(t, d)],
+                dtype=object,
+            )
 
-        return sols[1] - sols[0] + 1
+        t, d = t.astype(np.int64), d.astype(np.int64)
+        discriminant = t * t - 4 * d
+        root = np.sqrt(np.maximum(discriminant, 0).astype(np.float64))
+        low = np.maximum((t - root.astype(np.int64)) // 2, 0)
+        # the float root is off by a few at most
+        while (down := (low > 0) & ((low - 1) * (t - low + 1) > d)).any():
+            low -= down
+        while (up := (low <= t - low) & (low * (t - low) <= d)).any():
+            low += up
+        wins = np.maximum(t - 2 * low + 1, 0)
+        return np.where(discriminant < 0, 0, wins)
 
     def part_1(self):
-        opts = 1
-        for t, d in zip(*self.data1):
-            opts *= self.solve(t, d)
-        return opts
+        return math.prod(self.solve_many(*self.data1).tolist())
 
     def part_2(self):
         return self.solve(*self.data2)
@@ -1,198 +1,212 @@
-from enum import Enum
 from functools import cached_property
-from typing import List, Tuple
-
-from src import Day
-
-
-class Card(Enum):
-    rank: int
-
-    def __new__(cls, value: str, rank: int):
-        obj = object.__new__(cls)
-        obj._value_ = value
-        obj.rank = rank
-        return obj
-
-    def __lt__(self, other: "Card"):
-        return self.value < other.value
-
-    def __gt__(self, other: "Card"):
-        return self.value > other.value
-
-    def __eq__(self, other: "Card"):
-        return self.value == other.value
-
-    def __str__(self) -> str:
-        return self.value
-
-    def __hash__(self):
-        return hash(self.value)
-
-    ACE = ("A", 12)
-    KING = ("K", 11)
-    QUEEN = ("Q", 10)
-    JACK = ("J", 9)
-    TEN = ("T", 8)
-    NINE = ("9", 7)
-    EIGHT = ("8", 6)
-    SEVEN = ("7", 5)
-    SIX = ("6", 4)
-    FIVE = ("5", 3)
-    FOUR = ("4", 2)
-    THREE = ("3", 1)
-    TWO = ("2", 0)
-    JOKER = ("*", -1)
-
-
-class Rank(Enum):
-    def __lt__(self, other):
-        return self.value < other.value
-
-    def __gt__(self, other):
-        return self.value > other.value
-
-    def __eq__(self, other):
-        return self.value == other.value
-
-    HIGH_CARD = 0
-    ONE_PAIR = 1
-    TWO_PAIR = 2
-    THREE_OF_A_KIND = 3
-    FULL_HOUSE = 6
-    FOUR_OF_A_KIND = 7
-    FIVE_OF_A_KIND = 8
-
-
-class Hand:
-    def __init__(self, cards: List[Card]):
+from typing import Iterator, Sequence
+
+from src import Day, lazy_import
+from src.parse import integers
+
+np = lazy_import("numpy")
+
+# the number of cards in a hand
+HAND = 5
+
+# the hand types from weakest to strongest, each by the counts of its cards
+HIGH_CARD = (1, 1, 1, 1, 1)
+ONE_PAIR = (2, 1, 1, 1)
+TWO_PAIR = (2, 2, 1)
+THREE_OF_A_KIND = (3, 1, 1)
+FULL_HOUSE = (3, 2)
+FOUR_OF_A_KIND = (4, 1)
+FIVE_OF_A_KIND = (5,)
+PRECEDENCE = (
+    HIGH_CARD,
+    ONE_PAIR,
+    TWO_PAIR,
+    THREE_OF_A_KIND,
+    FULL_HOUSE,
+    FOUR_OF_A_KIND,
+    FIVE_OF_A_KIND,
+)
+
+
+def partitions(
+    n: int, largest: int | None = None
+) -> Iterator[tuple[int, ...]]:
+    """
+    Generate the ways to split n cards into groups of equal cards.
+
+    Args:
+        n (int): The number of cards.
+        largest (int | None): The size of the largest group allowed.
+
+    Yields:
+        tuple[int, ...]: The sizes of the groups, largest first.
+    """
+    if n == 0:
+        yield ()
+        return
+    for first in range(min(n, largest or n), 0, -1):
+        for rest in partitions(n - first, first):
+            yield (first, *rest)
+
+
+def _spread(groups: tuple[int, ...], wildcards: int) -> set[tuple[int, ...]]:
+    # every signature the wildcards can make, joining groups or their own
+    if not wildcards:
+        return {groups}
+    signatures = set()
+    for i in range(len(groups) + 1):
+        joined = list(groups) + [0]
+        joined[i] += 1
+        joined = tuple(sorted(filter(None, joined), reverse=True))
+        signatures |= _spread(joined, wildcards - 1)
+    return signatures
+
+
+class RuleSet:
+    """
+    A house rule for Camel Cards: the card order, the wildcards and the
+    precedence of the hand types.
+
+    Hands are classified by the sorted counts of their cards. With five
+    cards the sum of the squared counts tells these signatures apart, so
+    a table indexed by that sum and the number of wildcards gives the hand
+    type in a single lookup. Each entry already holds the best type the
+    wildcards can make under the precedence.
+    """
+
+    def __init__(
+        self,
+        order: str = "23456789TJQKA",
+        wildcards: str = "",
+        precedence: Sequence[tuple[int, ...]] = PRECEDENCE,
+    ) -> None:
         """
-        Initialize a Hand object with a list of cards.
-
         Args:
-            cards (List[Cards]): A list of Cards objects
-                representing the cards in the hand.
+            order (str): The cards from lowest to highest, wildcards
+                included.
+            wildcards (str): The cards that stand in for any card.
+            precedence (Sequence[tuple[int, ...]]): The hand types from
+                weakest to strongest, as the counts of their cards.
         """
-        self.cards = cards
+        if set(wildcards) - set(order):
+            raise ValueError(f"wildcards {wildcards!r} are not in the order")
+        if sorted(precedence) != sorted(partitions(HAND)):
+            raise ValueError("the precedence must rank every hand type once")
+        self.order = order
+        self.wildcards = wildcards
+        self.precedence = tuple(precedence)
 
     def __repr__(self) -> str:
+        return f"RuleSet({self.order!r}, {self.wildcards!r})"
+
+    @cached_property
+    def table(self) -> "np.ndarray":
         """
-        Return a string representation of the hand.
+        The hand type for every number of wildcards and signature.
 
         Returns:
-            str: A string representation of the hand.
+            np.ndarray: The strength of the best type, indexed by the
+                number of wildcards and the sum of the squared counts of
+                the other cards.
         """
-        return "".join(map(str, self.cards))
+        strength = {
+            signature: i for i, signature in enumerate(self.precedence)
+        }
+        table = np.full((HAND + 1, HAND * HAND + 1), -1, dtype=np.int64)
+        for wildcards in range(HAND + 1 if self.wildcards else 1):
+            for groups in partitions(HAND - wildcards):
+                best = max(map(strength.get, _spread(groups, wildcards)))
+                table[wildcards, sum(c * c for c in groups)] = best
+        return table
 
-    def __lt__(self, other):
+    @cached_property
+    def ranks(self) -> "np.ndarray":
+        # the rank of every byte, -1 for those that are not cards
+        ranks = np.full(256, -1, dtype=np.int8)
+        ranks[np.frombuffer(self.order.encode(), dtype=np.uint8)] = range(
+            len(self.order)
+        )
+        return ranks
+
+    def keys(self, hands: "np.ndarray") -> "np.ndarray":
         """
-        Compare two hands based on their ranks.
+        Encode every hand into one integer that sorts like the hand.
+
+        The hand type takes the high digits and the cards, in order, one
+        digit each below, in the base of the number of cards.
 
         Args:
-            other (Hand): The other hand to compare with.
+            hands (np.ndarray): The characters of every hand, as bytes of
+                shape (hands, 5).
+
+        Raises:
+            ValueError: If a hand holds a card not in the order.
 
         Returns:
-            bool: True if this hand is less than the other hand,
-                False otherwise.
+            np.ndarray: The key of every hand.
         """
-        if self.rank == other.rank:
-            for card, other_card in zip(self.cards, other.cards):
-                if card.rank == other_card.rank:
-                    continue
-                else:
-                    return card.rank < other_card.rank
-            return False
-        else:
-            return self.rank < other.rank
-
-    def _rank(self, cards: List[Card]) -> Rank:
-        """
-        Determine the rank of a hand based on its cards.
+        # one contiguous row per position, which numpy walks fastest
+        cards = np.ascontiguousarray(self.ranks[hands].T)
+        if (cards < 0).any():
+            raise ValueError("unknown card in the hands")
+        wild = np.isin(cards, self.ranks[list(self.wildcards.encode())])
+        tame = ~wild
 
-        Args:
-            cards (List[Cards]): A list of Cards objects representing
-                the cards in the hand.
+        # how many cards of each hand equal each card, ignoring wildcards
+        counts = [
+            ((cards == cards[i]) & tame).sum(axis=0, dtype=np.int64) * tame[i]
+            for i in range(HAND)
+        ]
+        # every card is counted once per copy, so the sum is the squares
+        keys = self.table[wild.sum(axis=0), sum(counts)]
+        for i in range(HAND):
+            keys = keys * len(self.order) + cards[i]
+        return keys
 
-        Returns:
-            HandRank: The rank of the hand.
-        """
-        cs = set(cards)
-        match len(cs):
-            case 1:
-                return Rank.FIVE_OF_A_KIND
-            case 2:
-                if any([cards.count(card) == 4 for card in cs]):
-                    return Rank.FOUR_OF_A_KIND
-                else:
-                    return Rank.FULL_HOUSE
-            case 3:
-                if any([cards.count(card) == 3 for card in cs]):
-                    return Rank.THREE_OF_A_KIND
-                else:
-                    return Rank.TWO_PAIR
-            case 4:
-                return Rank.ONE_PAIR
-            case _:
-                return Rank.HIGH_CARD
 
+CAMEL_CARDS = RuleSet()
+JOKERS = RuleSet("J23456789TQKA", wildcards="J")
+
+
+class Day7(Day):
     @cached_property
-    def rank(self) -> Rank:
+    def data(self):
         """
-        Get the rank of the hand.
+        Parse the hands and the bids.
 
         Returns:
-            HandRank: The rank of the hand.
+            tuple[np.ndarray, np.ndarray]: The characters of every hand,
+                as bytes of shape (hands, 5), and the bid of every hand.
         """
-        return self._rank(self.cards)
-
-
-class JokerHand(Hand):
-    @cached_property
-    def rank(self) -> Rank:
-        jokers = [card for card in self.cards if card == Card.JOKER]
-        nonjokers = [card for card in self.cards if card != Card.JOKER]
-
-        if len(jokers) == 0:
-            return self._rank(nonjokers)
-        elif len(jokers) == len(self.cards):
-            return Rank.FIVE_OF_A_KIND
-        else:
-            ranks = []
-            for card in set(nonjokers):
-                cards = nonjokers + [card] * len(jokers)
-                ranks.append(self._rank(cards))
-            return max(ranks)
-
+        text = np.frombuffer(self.buffer, dtype=np.uint8).copy()
+        starts = np.flatnonzero(text == ord("\n")) + 1
+        starts = np.concatenate(([0], starts[starts < len(text)]))
+        # every line starts with the cards, blanked out to leave the bids
+        # for the bulk parser
+        cells = starts[:, None] + np.arange(HAND)
+        hands = text[cells]
+        text[cells] = ord(" ")
+        return hands, integers(text.tobytes())
+
+    def winnings(self, rules: RuleSet = CAMEL_CARDS) -> int:
+        """
+        Sum the bids of the hands weighted by their rank under a rule set.
 
-class Day7(Day):
-    @property
-    def data(self) -> List[Tuple[Hand, int]]:
-        output = []
-        for line in self.raw_data:
-            hand, bid = line.split()
-            output.append((Hand([Card(card) for card in hand]), int(bid)))
+        Args:
+            rules (RuleSet): The house rules to rank the hands by.
 
-        return output
+        Returns:
+            int: The total winnings.
+        """
+        hands, bids = self.data
+        order = np.argsort(rules.keys(hands), kind="stable")
+        return int(bids[order] @ np.arange(1, len(bids) + 1))
 
     def part_1(self) -> int:
-        total_winnings = 0
-        for i, (_, bid) in enumerate(sorted(self.data)):
-            total_winnings += bid * (i + 1)
-        return total_winnings
+        return self.winnings(CAMEL_CARDS)
 
     def part_2(self) -> int:
-        new_data = []
-        for hand, bid in sorted(self.data):
-            new_hand = []
-            for card in hand.cards:
-                new_hand.append(card if card != Card.JACK else Card.JOKER)
-            new_data.append((JokerHand(new_hand), bid))
-
-        total_winnings = 0
-        for i, (_, bid) in enumerate(sorted(new_data)):
-            total_winnings += bid * (i + 1)
-
-        return total_winnings
+        return self.winnings(JOKERS)
 
 
 if __name__ == "__main__":
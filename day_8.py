@@ -1,9 +1,8 @@
-from collections import defaultdict
 from enum import Enum
 from functools import cached_property, reduce
 from math import gcd
 
-from src import Day
+from src import Day, Graph, Interner
 
 
 class Direction(Enum):
@@ -17,81 +16,61 @@ class Direction(Enum):
     R = ("R", 1)
 
 
-class Node:
-    def __init__(self, line: str) -> None:
-        self._line = line
-        source, dest = line.split(" = ")
-        self._source = source.strip()
-        self._dest = dest[1:-1].split(", ")
-
-    def __repr__(self) -> str:
-        return f"{self._source} -> ({self._dest[0]}, {self._dest[1]})"
-
-    def __eq__(self, __value: object) -> bool:
-        return self._source == __value
-
-    def __getitem__(self, idx: int) -> str:
-        return self._source[idx]
-
-    def move(self, direction: Direction):
-        return self._dest[direction.idx]
-
-    @property
-    def L(self):
-        return self.move(Direction.L)
-
-    @property
-    def R(self):
-        return self.move(Direction.R)
-
-
-class Network:
-    def __init__(self, nodes: list[Node]) -> None:
-        self._nodes = defaultdict(str)
-        for node in nodes:
-            self._nodes[node._source] = node
-
-    def __getitem__(self, idx: str) -> Node:
-        return self._nodes[idx]
-
-
 class Day8(Day):
     @cached_property
     def instructions(self):
         return [Direction[x] for x in self.raw_data[0]]
 
     @cached_property
-    def network(self):
-        return Network(self.nodes)
+    def names(self) -> Interner:
+        return Interner(line.split(" = ")[0] for line in self.raw_data[2:])
 
     @cached_property
-    def nodes(self):
-        return [Node(x) for x in self.raw_data[2::]]
-
-    def part_1(self):
-        node = self.network["AAA"]
+    def network(self) -> Graph:
+        # every node has exactly two edges, left then right
+        edges = []
+        for line in self.raw_data[2:]:
+            source, dest = line.split(" = ")
+            for node in dest[1:-1].split(", "):
+                edges.append((self.names(source), self.names(node)))
+        return Graph.from_edges(len(self.names), edges)
+
+    def walk(self, node: int, end) -> int:
+        """
+        Count the steps from a node until reaching an end node.
+
+        Args:
+            node (int): The id of the node to start from.
+            end (Callable[[str], bool]): Whether a node name is an end.
+
+        Returns:
+            int: The number of steps.
+        """
+        ends = [end(name) for name in self.names.names]
+        moves = [self.network.indices[d.idx :: 2] for d in Direction]
+        steps = [moves[d.idx] for d in self.instructions]
         i = 0
-        while node != "ZZZ":
-            node = self.network[
-                node.move(self.instructions[i % len(self.instructions)])
-            ]
+        while not ends[node]:
+            node = steps[i % len(steps)][node]
             i += 1
         return i
 
+    def parse(self) -> None:
+        self.instructions
+        self.network
+
+    def part_1(self):
+        return self.walk(self.names.ids["AAA"], lambda x: x == "ZZZ")
+
     def lcm(self, a, b):
         return a * b // gcd(a, b)
 
     def part_2(self):
-        nodes = list(filter(lambda x: x[-1] == "A", self.nodes))
-        loops = []
-        for node in nodes:
-            i = 0
-            while node[-1] != "Z":
-                node = self.network[
-                    node.move(self.instructions[i % len(self.instructions)])
-                ]
-                i += 1
-            loops.append(i)
+        loops = [
+            self.walk(node, lambda x: x[-1] == "Z")
+            for node, name in enumerate(self.names.names)
+            if name[-1] == "A"
+        ]
 
         return reduce(self.lcm, loops)
 
@@ -1,27 +1,66 @@
-from src import Day
+from src import Day, lazy_import
+from src.parse import rows
 from functools import cached_property
 
+np = lazy_import("numpy")
+
 
 class Day9(Day):
     @cached_property
     def data(self):
-        lists = []
-        for line in self.raw_data:
-            lists.append(tuple(map(int, line.split())))
-        return lists
+        try:
+            return rows(self.buffer)
+        except ValueError:
+            # sequences of different lengths are solved one by one
+            return None
+
+    @staticmethod
+    def _parse(line):
+        return tuple(map(int, line.split()))
 
     def part_1(self):
+        if not self.streaming and self.data is not None:
+            return self.extrapolate(self.data)
         output = 0
-        for line in self.data:
+        for line in map(self._parse, self.lines):
             output += self.solve(line)
         return output
 
     def part_2(self):
+        if not self.streaming and self.data is not None:
+            return self.extrapolate(self.data, backwards=True)
         output = 0
-        for line in self.data:
+        for line in map(self._parse, self.lines):
             output += self.solve(line, backwards=True)
         return output
 
+    @staticmethod
+    def extrapolate(sequences, backwards=False):
+        """
+        Sum the extrapolated values of many sequences of equal length.
+
+        Works on all sequences at once, one level of differences at a time:
+        the next value is the sum of the last elements of every level, the
+        previous one the alternating sum of the first elements.
+
+        Args:
+            sequences (np.ndarray): The sequences, one per row.
+            backwards (bool): Whether to extrapolate before the first value.
+
+        Returns:
+            int: The sum of the extrapolated values.
+        """
+        output = 0
+        sign = 1
+        while sequences.size and sequences.any():
+            if backwards:
+                output += sign * int(sequences[:, 0].sum())
+                sign = -sign
+            else:
+                output += int(sequences[:, -1].sum())
+            sequences = np.diff(sequences, axis=1)
+        return output
+
     @classmethod
     def solve(cls, lst, backwards=False):
         if all([x == 0 for x in lst]):
@@ -1,3 +1,14 @@
+from .cache import persistent_property
 from .day import Day
+from .graph import Graph, Interner
+from .grid import Grid
+from .lazy import lazy_import
 
-__all__ = ["Day"]
+__all__ = [
+    "Day",
+    "Graph",
+    "Grid",
+    "Interner",
+    "lazy_import",
+    "persistent_property",
+]
@@ -0,0 +1,181 @@
+import asyncio
+import multiprocessing
+import os
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any
+
+from .batch import solve_part, warm
+from .day import PART_NAMES
+from .runner import discover
+
+# the seconds a request may take, including the wait for a worker
+TIMEOUT = 60.0
+
+
+class SolveError(Exception):
+    pass
+
+
+def _serve(conn: Connection) -> None:
+    warm()
+    while True:
+        try:
+            day, part, input = conn.recv()
+        except EOFError:
+            return
+        conn.send(solve_part(day, part, input))
+
+
+class _Worker:
+    """
+    A warm worker process solving one request at a time over a pipe.
+
+    Unlike the workers of a ProcessPoolExecutor it can be killed in the
+    middle of a request, and replaced, without affecting the others.
+    """
+
+    def __init__(self, context: multiprocessing.context.BaseContext) -> None:
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child,))
+        self.process.daemon = True
+        self.process.start()
+        child.close()
+
+    async def call(self, request: tuple) -> dict[str, Any]:
+        await asyncio.to_thread(self.conn.send, request)
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        fd = self.conn.fileno()
+        loop.add_reader(fd, lambda: ready.done() or ready.set_result(None))
+        try:
+            await ready
+        finally:
+            loop.remove_reader(fd)
+        return self.conn.recv()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class Solver:
+    """
+    Solves puzzles concurrently from asyncio on a set of warm workers.
+
+    Inputs given as paths are read in a thread, and the parts are solved in
+    worker processes, so the event loop never blocks. At most in_flight
+    requests are admitted at once, and the others wait for a slot, which
+    pushes back on producers instead of queueing without bound. A request
+    that times out or is cancelled kills its worker, which is replaced by a
+    fresh one, so a pathological input cannot hold on to a worker.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        in_flight: int | None = None,
+        timeout: float | None = TIMEOUT,
+    ) -> None:
+        workers = workers or os.cpu_count() or 1
+        self.days = discover()
+        self.timeout = timeout
+        self.context = multiprocessing.get_context("spawn")
+        self.slots = asyncio.Semaphore(in_flight or 4 * workers)
+        self.idle: asyncio.Queue[_Worker] = asyncio.Queue()
+        self.workers = {_Worker(self.context) for _ in range(workers)}
+        for worker in self.workers:
+            self.idle.put_nowait(worker)
+
+    async def solve(
+        self,
+        day: int,
+        part: int,
+        input: bytes | str | Path,
+        timeout: float | None = None,
+    ) -> Any:
+        """
+        Solve a part of a day.
+
+        Args:
+            day (int): The day number.
+            part (int): The part of the puzzle, 1 or 2.
+            input (bytes | str | Path): The contents of the input, or its
+                path.
+            timeout (float | None): The seconds to allow instead of the
+                solver's timeout, counted once the request is admitted.
+
+        Raises:
+            ValueError: If there is no solver for the day and part.
+            TimeoutError: If the request took too long.
+            SolveError: If the solver raised, or its worker died.
+
+        Returns:
+            Any: The answer.
+        """
+        if day not in self.days or part not in PART_NAMES:
+            raise ValueError(f"no solver for day {day} part {part}")
+
+        async with self.slots:
+            async with asyncio.timeout(timeout or self.timeout):
+                if not isinstance(input, bytes):
+                    input = await asyncio.to_thread(Path(input).read_bytes)
+                worker = await self.idle.get()
+                try:
+                    result = await worker.call((day, part, input))
+                except BaseException as e:
+                    self._replace(worker)
+                    if isinstance(e, (EOFError, OSError)):
+                        raise SolveError(f"the worker died: {e!r}") from e
+                    raise
+                self.idle.put_nowait(worker)
+
+        if "error" in result:
+            raise SolveError(result["error"])
+        return result["answer"]
+
+    def _replace(self, worker: _Worker) -> None:
+        worker.kill()
+        self.workers.discard(worker)
+        if self.context is not None:
+            self.workers.add(fresh := _Worker(self.context))
+            self.idle.put_nowait(fresh)
+
+    def close(self) -> None:
+        """
+        Kill the workers, cancelling the requests they are solving.
+        """
+        self.context = None
+        for worker in self.workers:
+            worker.kill()
+        self.workers.clear()
+
+    async def __aenter__(self) -> "Solver":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+
+_default: tuple[asyncio.AbstractEventLoop, Solver] | None = None
+
+
+async def solve(
+    day: int,
+    part: int,
+    input: bytes | str | Path,
+    timeout: float | None = None,
+) -> Any:
+    """
+    Solve a part of a day on a shared Solver of the running event loop.
+
+    See Solver.solve.
+    """
+    global _default
+    loop = asyncio.get_running_loop()
+    if _default is None or _default[0] is not loop:
+        if _default is not None:
+            _default[1].close()
+        _default = loop, Solver()
+    return await _default[1].solve(day, part, input, timeout)
@@ -0,0 +1,237 @@
+import argparse
+import glob
+import json
+import os
+import sys
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator
+
+from .day import PART_NAMES, Day
+from .instrument import measure
+from .lazy import load_lazy_imports
+from .runner import disable_caches, discover, load
+
+# the input bytes of the Day instances each worker keeps, whose parsed
+# inputs take a small multiple of that
+INSTANCE_BYTES = 64 << 20
+
+_instances: OrderedDict[tuple[int, str], tuple[Day, int]] = OrderedDict()
+_instance_bytes = 0
+
+
+def inputs(patterns: Iterable[str]) -> list[Path]:
+    """
+    Expand directories and glob patterns into input files.
+
+    Args:
+        patterns (Iterable[str]): Directories, whose files are all taken,
+            glob patterns or plain paths.
+
+    Returns:
+        list[Path]: The input files, sorted and without duplicates.
+    """
+    paths = set()
+    for pattern in patterns:
+        if Path(pattern).is_dir():
+            paths.update(p for p in Path(pattern).iterdir() if p.is_file())
+        else:
+            paths.update(Path(p) for p in glob.glob(pattern, recursive=True))
+    return sorted(paths)
+
+
+def _initialize(day: int, cache: bool) -> None:
+    # warm the worker: import the solver and its dependencies only once
+    if not cache:
+        disable_caches()
+    load(day)
+    load_lazy_imports()
+
+
+def _solve(day: int, parts: tuple[int, ...], input: str) -> list[dict]:
+    cls = load(day)
+    records = []
+    for part in parts:
+        if cls.part_name(part) is None:
+            continue
+        m = measure(day, cls, input, part)
+        records.append(
+            {
+                "input": input,
+                "day": day,
+                "part": part,
+                "answer": m.answer,
+                "parse_seconds": m.parse_seconds,
+                "solve_seconds": m.solve_seconds,
+                "cached": m.cached,
+                "error": m.error,
+            }
+        )
+    return records
+
+
+def warm() -> None:
+    """
+    Import every solver and its dependencies up front in a worker.
+    """
+    for day in discover():
+        load(day)
+    load_lazy_imports()
+
+
+def _instance(day: int, input: str | bytes) -> Day:
+    # reuse the instance of an earlier request for the same input, whose
+    # cached properties already hold the parsed input
+    global _instance_bytes
+    instance = load(day)(input)
+    key = (day, instance.digest)
+    if key in _instances:
+        _instances.move_to_end(key)
+        return _instances[key][0]
+    size = len(instance.buffer)
+    if size > INSTANCE_BYTES:
+        return instance
+    _instances[key] = instance, size
+    _instance_bytes += size
+    while _instance_bytes > INSTANCE_BYTES:
+        _instance_bytes -= _instances.popitem(last=False)[1][1]
+    return instance
+
+
+def solve_part(day: int, part: int, input: str | bytes) -> dict[str, Any]:
+    """
+    Solve a part of a day in a warm worker.
+
+    The worker keeps the most recently used Day instances, up to
+    INSTANCE_BYTES of input, so a repeated input skips parsing as well.
+
+    Args:
+        day (int): The day number.
+        part (int): The part of the puzzle, 1 or 2.
+        input (str | bytes): The path of the input, or its contents.
+
+    Returns:
+        dict[str, Any]: The answer, or the error.
+    """
+    try:
+        return {"answer": _instance(day, input).answer(part)}
+    except Exception as e:
+        return {"error": repr(e)}
+
+
+def _run(
+    day: int,
+    parts: tuple[int, ...],
+    queue: deque[str],
+    workers: int,
+    cache: bool,
+):
+    # solves inputs from the queue until it is empty or a worker dies, and
+    # returns the inputs that were in flight when the pool broke
+    lost = {}
+    with ProcessPoolExecutor(
+        workers, initializer=_initialize, initargs=(day, cache)
+    ) as pool:
+        running = {}
+        while queue or running:
+            # only a few inputs are submitted ahead, so that a dying worker
+            # takes as few inputs as possible down with it
+            while queue and not lost and len(running) < 2 * workers:
+                input = queue.popleft()
+                try:
+                    future = pool.submit(_solve, day, parts, input)
+                except BrokenProcessPool:
+                    queue.appendleft(input)
+                    break
+                running[future] = input
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                input = running.pop(future)
+                try:
+                    yield from future.result()
+                except BrokenProcessPool as e:
+                    lost[input] = e
+                except Exception as e:
+                    yield {"input": input, "day": day, "error": repr(e)}
+    return lost
+
+
+def batch(
+    day: int,
+    paths: Iterable[Path],
+    parts: Iterable[int] = tuple(PART_NAMES),
+    workers: int | None = None,
+    cache: bool = True,
+) -> Iterator[dict[str, Any]]:
+    """
+    Solve one day for many inputs in a pool of warm worker processes.
+
+    Every worker imports the solver once and then solves inputs until
+    there are none left. An input whose solver raises only fails its own
+    records. A worker dying outright, e.g. out of memory, breaks the pool:
+    the inputs that were in flight are then solved again one at a time,
+    each in a fresh worker, so that only those killing it fail, and the
+    others carry on in a fresh pool. Records are yielded as soon as their
+    input is solved, so in no particular order.
+
+    Args:
+        day (int): The day number.
+        paths (Iterable[Path]): The inputs to solve.
+        parts (Iterable[int]): The parts to solve for each input.
+        workers (int | None): The size of the process pool, defaults to
+            the number of CPUs.
+        cache (bool): Whether to use the on-disk caches.
+
+    Yields:
+        dict[str, Any]: One record per input and part, with the answer or
+            the error.
+    """
+    parts = tuple(parts)
+    workers = workers or os.cpu_count() or 1
+    queue = deque(str(path) for path in paths)
+    while queue:
+        lost = yield from _run(day, parts, queue, workers, cache)
+        for input in lost:
+            # a lost input is retried alone, which tells if it killed the
+            # worker or was only in flight alongside the one that did
+            errors = yield from _run(day, parts, deque([input]), 1, cache)
+            for e in errors.values():
+                yield {"input": input, "day": day, "error": repr(e)}
+
+
+def main(argv: list[str] | None = None, output: IO[str] = sys.stdout) -> int:
+    parser = argparse.ArgumentParser(
+        description="Solve one day for many inputs, as JSON lines."
+    )
+    parser.add_argument("day", type=int)
+    parser.add_argument(
+        "inputs", nargs="+", help="input files, directories or glob patterns"
+    )
+    parser.add_argument(
+        "-p",
+        "--parts",
+        type=int,
+        nargs="+",
+        choices=sorted(PART_NAMES),
+        default=sorted(PART_NAMES),
+    )
+    parser.add_argument("-w", "--workers", type=int)
+    parser.add_argument("--no-cache", dest="cache", action="store_false")
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for record in batch(
+        args.day, inputs(args.inputs), args.parts, args.workers, args.cache
+    ):
+        failed += record["error"] is not None
+        output.write(json.dumps(record, default=str) + "\n")
+        output.flush()
+    return int(bool(failed))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
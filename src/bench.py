@@ -0,0 +1,191 @@
+import argparse
+import math
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from .day import PART_NAMES
+from .generators import GENERATORS, generate
+from .instrument import Measurement
+from .lazy import load_lazy_imports
+from .runner import disable_caches, load, solve
+
+SCALES = (0.25, 0.5, 1.0)
+
+
+class Sample(NamedTuple):
+    scale: float
+    size: int
+    measurement: Measurement
+
+
+def _solve(
+    day: int, part: int, input: str, memory: bool = False
+) -> Measurement | None:
+    # import costs are tracked by src.importtime, not by the benchmarks
+    try:
+        load(day)
+        load_lazy_imports()
+    except Exception:
+        pass  # solve reports the error
+    return solve(day, part, input, memory)
+
+
+def exponent(samples: list[Sample]) -> float | None:
+    """
+    Estimate k in time ~ size ** k with a least squares fit in log-log space.
+
+    Args:
+        samples (list[Sample]): The samples of one day and part.
+
+    Returns:
+        float | None: The empirical exponent, or None without enough data.
+    """
+    points = [
+        (math.log(s.size), math.log(s.measurement.seconds))
+        for s in samples
+        if s.measurement.error is None and s.measurement.seconds > 0
+    ]
+    if len(points) < 2:
+        return None
+    mx = sum(x for x, _ in points) / len(points)
+    my = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mx) ** 2 for x, _ in points)
+    if sxx == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in points) / sxx
+
+
+def bench(
+    days: Iterable[int],
+    parts: Iterable[int] = tuple(PART_NAMES),
+    scales: Iterable[float] = SCALES,
+    seed: int = 0,
+    workers: int = 1,
+    memory: bool = False,
+    input_dir: Path | None = None,
+) -> dict[tuple[int, int], list[Sample]]:
+    """
+    Solve synthetic inputs of increasing size for every day and part.
+
+    Every measurement runs in a fresh worker process without the on-disk
+    caches, so state cached by one run cannot speed up the next. Heavy
+    dependencies are imported before the clock starts, so their one-off
+    import cost does not drown out the solver on small inputs.
+
+    Args:
+        days (Iterable[int]): The days to benchmark.
+        parts (Iterable[int]): The parts to benchmark for each day.
+        scales (Iterable[float]): The input scale factors to run.
+        seed (int): The seed of the input generators.
+        workers (int): The number of worker processes. More than one
+            makes the runs compete for the CPU.
+        memory (bool): Whether to record the peak memory of each run.
+        input_dir (Path | None): Where to keep the generated inputs,
+            defaults to a temporary directory.
+
+    Returns:
+        dict[tuple[int, int], list[Sample]]: The samples per day and part.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(input_dir or tmp)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        tasks = []
+        for day in days:
+            for scale in scales:
+                path = directory / f"day_{day}_x{scale:g}_s{seed}.txt"
+                path.write_text(generate(day, scale, seed))
+                size = path.stat().st_size
+                for part in parts:
+                    tasks.append((day, part, scale, size, str(path)))
+
+        with ProcessPoolExecutor(
+            workers, max_tasks_per_child=1, initializer=disable_caches
+        ) as pool:
+            futures = [
+                pool.submit(_solve, day, part, path, memory)
+                for day, part, _, _, path in tasks
+            ]
+            measurements = [f.result() for f in futures]
+
+    samples = {}
+    for (day, part, scale, size, _), m in zip(tasks, measurements):
+        if m is not None:
+            samples.setdefault((day, part), []).append(Sample(scale, size, m))
+    return samples
+
+
+def report(samples: dict[tuple[int, int], list[Sample]]) -> str:
+    """
+    Format benchmark samples with the fitted complexity of each part.
+
+    Args:
+        samples (dict[tuple[int, int], list[Sample]]): The samples.
+
+    Returns:
+        str: A plain-text report.
+    """
+    lines = []
+    for (day, part), runs in sorted(samples.items()):
+        k = exponent(runs)
+        fit = "n/a" if k is None else f"~n^{k:.2f}"
+        lines.append(f"Day {day} part {part}: {fit}")
+        for s in runs:
+            m = s.measurement
+            timing = (
+                f"error: {m.error}"
+                if m.error
+                else f"parse {m.parse_seconds:8.3f}s  "
+                f"solve {m.solve_seconds:8.3f}s"
+            )
+            peak = (
+                ""
+                if m.peak_memory is None
+                else f"  {m.peak_memory / 1e6:.1f}MB"
+            )
+            lines.append(f"  x{s.scale:<6g} {s.size:>10} B  {timing}{peak}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the solvers on synthetic inputs."
+    )
+    parser.add_argument("-d", "--days", type=int, nargs="+")
+    parser.add_argument(
+        "-p",
+        "--parts",
+        type=int,
+        nargs="+",
+        choices=sorted(PART_NAMES),
+        default=sorted(PART_NAMES),
+    )
+    parser.add_argument(
+        "-s", "--scales", type=float, nargs="+", default=list(SCALES)
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-w", "--workers", type=int, default=1)
+    parser.add_argument("-m", "--memory", action="store_true")
+    parser.add_argument(
+        "--keep-inputs", type=Path, help="write the inputs to this directory"
+    )
+    args = parser.parse_args(argv)
+
+    samples = bench(
+        args.days or sorted(GENERATORS),
+        args.parts,
+        args.scales,
+        args.seed,
+        args.workers,
+        args.memory,
+        args.keep_inputs,
+    )
+    print(report(samples))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
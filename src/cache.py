@@ -0,0 +1,203 @@
+import hashlib
+import os
+import pickle
+import sys
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Any, Callable
+
+CACHE_DIR = Path(
+    os.environ.get(
+        "AOC_CACHE_DIR", Path(__file__).resolve().parent.parent / ".cache"
+    )
+)
+
+MISSING = object()
+
+
+class DiskCache:
+    """
+    A size-bounded, least recently used store of pickled values on disk.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = 256 << 20) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # the bytes on disk as last scanned, plus this process's writes
+        self.size: int | None = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Load a value, marking it as recently used.
+
+        Args:
+            key (str): The key of the value.
+            default (Any): Returned when the key is not cached.
+
+        Returns:
+            Any: The cached value, or the default.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return default
+        except Exception:
+            # stale entries whose classes changed are dropped, not fatal
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Store a value and evict the least recently used entries over budget.
+
+        Args:
+            key (str): The key of the value.
+            value (Any): The picklable value to store.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        os.replace(tmp, path)
+
+        # only scan the directory when the tracked size goes over budget,
+        # which also picks up the writes of other processes
+        if self.size is None:
+            self.evict()
+        else:
+            self.size += path.stat().st_size
+            self.size -= replaced
+            if self.size > self.max_bytes:
+                self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until within budget.
+
+        Scans the whole directory, so it is only run when needed.
+        """
+        entries = []
+        for path in self.directory.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self.size = total
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for path in self.directory.glob("*.pickle"):
+            path.unlink(missing_ok=True)
+        self.size = 0
+
+
+@lru_cache(maxsize=None)
+def package_version() -> str:
+    """
+    Fingerprint the sources of the src package the solvers build on.
+
+    Returns:
+        str: The SHA-256 of every module of the package, in name order.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(Path(__file__).parent.rglob("*.py")):
+        digest.update(
+            path.relative_to(Path(__file__).parent).as_posix().encode()
+        )
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def code_version(module: str) -> str:
+    """
+    Fingerprint the source of a module, so results expire when it changes.
+
+    The sources of the src package are included, as the solvers rely on
+    its parsers, grids and graphs, and a fix there must expire them too.
+
+    Args:
+        module (str): The name of an imported module.
+
+    Returns:
+        str: The SHA-256 of the module and package sources, or just of the
+            package if the module has no file.
+    """
+    path = getattr(sys.modules.get(module), "__file__", None)
+    if path is None:
+        return package_version()
+    source = Path(path).read_bytes() + package_version().encode()
+    return hashlib.sha256(source).hexdigest()
+
+
+class _PersistentProperty(cached_property):
+    def __init__(self, func: Callable, version: int) -> None:
+        super().__init__(func)
+        self.version = version
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if self.attrname in instance.__dict__:
+            return instance.__dict__[self.attrname]
+
+        cache = getattr(instance, "parse_cache", None)
+        if cache is None:
+            return super().__get__(instance, owner)
+
+        cls = type(instance)
+        key = hashlib.sha256(
+            f"{cls.__module__}.{cls.__qualname__}.{self.attrname}:"
+            f"{self.version}:{instance.digest}".encode()
+        ).hexdigest()
+        if (value := cache.get(key, MISSING)) is MISSING:
+            value = self.func(instance)
+            cache.put(key, value)
+        instance.__dict__[self.attrname] = value
+        return value
+
+
+def persistent_property(version: int = 1) -> Callable:
+    """
+    Like functools.cached_property, but also cached on disk across runs.
+
+    Values are keyed by the solver class, the attribute, the parser version
+    and the SHA-256 of the input, and stored in the parse_cache of the
+    instance. Bump the version whenever the parsed representation changes.
+
+    Args:
+        version (int): The version of the parser.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(func: Callable) -> _PersistentProperty:
+        return _PersistentProperty(func, version)
+
+    return decorator
@@ -1,13 +1,271 @@
+import hashlib
+import io
+import mmap
+from functools import cached_property
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
+
+from .cache import CACHE_DIR, MISSING, DiskCache, code_version
+
+CHUNK_SIZE = 1 << 16
+
+# the method names under which solvers implement each part
+PART_NAMES = {1: ("part_1", "part1"), 2: ("part_2", "part2")}
+
+
 class Day:
-    def __init__(self, input: str) -> None:
+    # parsed inputs, see src.cache.persistent_property; None disables it
+    parse_cache: DiskCache | None = DiskCache(CACHE_DIR / "parsed")
+    # answers of solved parts, see Day.answer; None disables it
+    result_cache: DiskCache | None = DiskCache(
+        CACHE_DIR / "results", max_bytes=64 << 20
+    )
+
+    def __init__(self, input: str | bytes, streaming: bool = False) -> None:
+        # a path, or the contents of the input itself
         self._input = input
-        pass
+        self._buffer = None
+        # number of times the input file was actually read from disk
+        self.reads = 0
+        # solvers that support it read their input lazily when streaming
+        self.streaming = streaming
+
+    @classmethod
+    def part_name(cls, part: int) -> str | None:
+        """
+        Find the name of the method implementing a part of the puzzle.
+
+        Args:
+            part (int): The part of the puzzle, 1 or 2.
+
+        Returns:
+            str | None: The method name, or None if the part is missing.
+        """
+        for name in PART_NAMES.get(part, ()):
+            if callable(getattr(cls, name, None)):
+                return name
+        return None
+
+    def part(self, part: int) -> Callable[..., Any]:
+        """
+        Get the bound method implementing a part of the puzzle.
+
+        Args:
+            part (int): The part of the puzzle, 1 or 2.
+
+        Returns:
+            Callable[..., Any]: The method solving that part.
+        """
+        if (name := self.part_name(part)) is None:
+            raise NotImplementedError(
+                f"{self.__class__.__name__} has no part {part}"
+            )
+        return getattr(self, name)
+
+    def answer(self, part: int, *args: Any) -> Any:
+        """
+        Solve a part of the puzzle, reusing the answer of an earlier run.
+
+        Answers are stored in the result_cache keyed by the solver class,
+        the part, its arguments, the input digest and the sources of the
+        module defining the solver and of the src package.
+
+        Args:
+            part (int): The part of the puzzle, 1 or 2.
+            *args (Any): Extra arguments of the part method.
+
+        Returns:
+            Any: The answer.
+        """
+        if (value := self.cached_answer(part, *args)) is MISSING:
+            value = self.compute(part, *args)
+        return value
+
+    def cached_answer(self, part: int, *args: Any) -> Any:
+        """
+        Look up the answer of an earlier run without solving anything.
+
+        Args:
+            part (int): The part of the puzzle, 1 or 2.
+            *args (Any): Extra arguments of the part method.
+
+        Returns:
+            Any: The answer, or MISSING if it is not in the result_cache.
+        """
+        self.part(part)
+        if (cache := self.result_cache) is None:
+            return MISSING
+        return cache.get(self._answer_key(part, args), MISSING)
+
+    def compute(self, part: int, *args: Any) -> Any:
+        """
+        Solve a part of the puzzle and store the answer in the result_cache.
+
+        Args:
+            part (int): The part of the puzzle, 1 or 2.
+            *args (Any): Extra arguments of the part method.
+
+        Returns:
+            Any: The answer.
+        """
+        value = self.part(part)(*args)
+        if (cache := self.result_cache) is not None:
+            cache.put(self._answer_key(part, args), value)
+        return value
+
+    def _answer_key(self, part: int, args: tuple) -> str:
+        cls = self.__class__
+        return hashlib.sha256(
+            f"{cls.__module__}.{cls.__qualname__}:{part}:{args!r}:"
+            f"{self.digest}:{code_version(cls.__module__)}".encode()
+        ).hexdigest()
+
+    def _load(self) -> mmap.mmap | bytes:
+        """
+        Map the input file into memory, reading it at most once.
+
+        Inputs given as bytes are used as they are.
+
+        Returns:
+            mmap.mmap | bytes: The read-only buffer backing the input.
+        """
+        if self._buffer is None and isinstance(self._input, bytes):
+            self._buffer = self._input
+        elif self._buffer is None:
+            with open(self._input, "rb") as f:
+                try:
+                    self._buffer = mmap.mmap(
+                        f.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+                except ValueError:
+                    # empty files cannot be memory-mapped
+                    self._buffer = b""
+            self.reads += 1
+        return self._buffer
+
+    def _open(self) -> BinaryIO:
+        if isinstance(self._input, bytes):
+            return io.BytesIO(self._input)
+        return open(self._input, "rb")
 
     @property
+    def buffer(self) -> memoryview:
+        """
+        Zero-copy view on the raw bytes of the input.
+
+        Returns:
+            memoryview: A read-only view on the input bytes.
+        """
+        return memoryview(self._load())
+
+    @cached_property
+    def digest(self) -> str:
+        """
+        The SHA-256 of the input bytes.
+
+        Returns:
+            str: The hexadecimal digest.
+        """
+        return hashlib.sha256(self.buffer).hexdigest()
+
+    @cached_property
     def raw_data(self) -> list[str]:
-        with open(self._input) as f:
-            return [line.strip() for line in f.readlines()]
+        lines = str(self.buffer, "utf-8").split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        return [line.strip() for line in lines]
 
     @property
     def data(self) -> list:
         return self.raw_data
+
+    def parse(self) -> None:
+        """
+        Parse the whole input ahead of solving.
+
+        Lets measurements tell parsing apart from solving. Solvers keeping
+        their parsed input somewhere other than data override this to
+        build it.
+        """
+        self.data
+
+    @property
+    def lines(self) -> Iterable[str]:
+        """
+        The input lines, streamed from disk when in streaming mode.
+
+        Returns:
+            Iterable[str]: The stripped lines of the input.
+        """
+        return self.iter_lines() if self.streaming else self.raw_data
+
+    def iter_split(
+        self, delimiter: str = "\n", chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[str]:
+        """
+        Lazily split the input file on a delimiter, reading it in chunks.
+
+        Only the current chunk and the token being assembled are kept in
+        memory, so this works for inputs that do not fit in memory.
+
+        Args:
+            delimiter (str): The delimiter to split on.
+            chunk_size (int): The number of bytes to read at a time.
+
+        Yields:
+            str: The tokens between delimiters, without the delimiter.
+        """
+        sep = delimiter.encode()
+        buffer = bytearray()
+        with self._open() as f:
+            self.reads += 1
+            while chunk := f.read(chunk_size):
+                buffer += chunk
+                start = 0
+                while (end := buffer.find(sep, start)) != -1:
+                    yield buffer[start:end].decode()
+                    start = end + len(sep)
+                del buffer[:start]
+        if buffer:
+            yield buffer.decode()
+
+    def iter_lines(self, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+        """
+        Lazily iterate over the stripped lines of the input.
+
+        Lines come from memory if the input was already loaded, and are
+        streamed from disk otherwise.
+
+        Args:
+            chunk_size (int): The number of bytes to read at a time.
+
+        Yields:
+            str: The stripped lines of the input.
+        """
+        if "raw_data" in self.__dict__:
+            yield from self.raw_data
+        else:
+            for line in self.iter_split("\n", chunk_size):
+                yield line.strip()
+
+    def iter_records(
+        self, separator: str = "", chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[list[str]]:
+        """
+        Lazily group the input lines into records.
+
+        Args:
+            separator (str): The line that separates two records.
+            chunk_size (int): The number of bytes to read at a time.
+
+        Yields:
+            list[str]: The lines of each record.
+        """
+        record = []
+        for line in self.iter_lines(chunk_size):
+            if line == separator:
+                yield record
+                record = []
+            else:
+                record.append(line)
+        if record:
+            yield record
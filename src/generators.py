@@ -0,0 +1,505 @@
+"""
+Synthetic, size-scalable puzzle inputs for every day.
+
+Each generator takes a scale factor and a seeded random number generator
+and returns the text of a valid puzzle input. A scale of 1 produces an
+input of roughly the size of the real puzzle input; the count of lines,
+records or grid cells grows linearly with the scale.
+"""
+import math
+import random
+import string
+from typing import Callable
+
+ALPHABET = string.ascii_lowercase
+SPELLED = [
+    "one",
+    "two",
+    "three",
+    "four",
+    "five",
+    "six",
+    "seven",
+    "eight",
+    "nine",
+]
+
+
+def _count(base: int, scale: float, minimum: int = 1) -> int:
+    return max(minimum, round(base * scale))
+
+
+def _side(base: int, scale: float, minimum: int = 3) -> int:
+    # grid sides grow with the square root so the cell count is linear
+    return max(minimum, round(base * math.sqrt(scale)))
+
+
+def _names(rng: random.Random, n: int, length: int) -> list[str]:
+    names = set()
+    while len(names) < n:
+        names.add("".join(rng.choices(ALPHABET, k=length)))
+    return sorted(names)
+
+
+def day_1(scale: float, rng: random.Random) -> str:
+    lines = []
+    for _ in range(_count(1000, scale)):
+        tokens = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 6)):
+            kind = rng.randrange(3)
+            if kind == 0:
+                tokens.append(str(rng.randint(1, 9)))
+            elif kind == 1:
+                tokens.append(rng.choice(SPELLED))
+            else:
+                tokens.append("".join(rng.choices(ALPHABET, k=3)))
+        rng.shuffle(tokens)
+        lines.append("".join(tokens))
+    return "\n".join(lines) + "\n"
+
+
+def day_2(scale: float, rng: random.Random) -> str:
+    lines = []
+    for game in range(1, _count(100, scale) + 1):
+        sets = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            sets.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colors))
+        lines.append(f"Game {game}: {'; '.join(sets)}")
+    return "\n".join(lines) + "\n"
+
+
+def day_3(scale: float, rng: random.Random) -> str:
+    side = _side(140, scale)
+    lines = []
+    for _ in range(side):
+        row = []
+        while len(row) < side:
+            r = rng.random()
+            if r < 0.08 and len(row) + 4 <= side:
+                row.extend(str(rng.randint(1, 999)) + ".")
+            elif r < 0.12:
+                row.append(rng.choice("*#+$/@=%&-"))
+            else:
+                row.append(".")
+        lines.append("".join(row[:side]))
+    return "\n".join(lines) + "\n"
+
+
+def day_4(scale: float, rng: random.Random) -> str:
+    lines = []
+    n = _count(200, scale)
+    for card in range(1, n + 1):
+        # keep the expected number of matches below one, so the number of
+        # copies in part 2 grows linearly rather than exponentially
+        matches = 0 if rng.random() < 0.6 else rng.randint(1, 3)
+        matches = min(matches, n - card)
+        numbers = rng.sample(range(1, 100), 35)
+        winning = numbers[:10]
+        have = winning[:matches] + numbers[10 : 35 - matches]
+        rng.shuffle(have)
+        lines.append(
+            f"Card {card:>4}: {' '.join(f'{x:>2}' for x in winning)} | "
+            f"{' '.join(f'{x:>2}' for x in have)}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def day_5(scale: float, rng: random.Random) -> str:
+    stages = [
+        "seed",
+        "soil",
+        "fertilizer",
+        "water",
+        "light",
+        "temperature",
+        "humidity",
+        "location",
+    ]
+    limit = 1 << 32
+    seeds = []
+    for _ in range(_count(10, scale)):
+        seeds.extend([rng.randrange(limit - 10**8), rng.randint(1, 10**8)])
+    blocks = [f"seeds: {' '.join(map(str, seeds))}"]
+    for src, dest in zip(stages, stages[1:]):
+        n = _count(30, scale)
+        cuts = sorted(rng.sample(range(1, limit), 2 * n))
+        lines = [f"{src}-to-{dest} map:"]
+        for start, stop in zip(cuts[::2], cuts[1::2]):
+            size = stop - start
+            lines.append(f"{rng.randrange(limit - size)} {start} {size}")
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks) + "\n"
+
+
+def day_6(scale: float, rng: random.Random) -> str:
+    times, distances = [], []
+    for _ in range(_count(4, scale)):
+        t = rng.randint(7, 99)
+        times.append(t)
+        distances.append(rng.randint(1, t * t // 4 - 1))
+    return (
+        f"Time:     {' '.join(f'{x:>4}' for x in times)}\n"
+        f"Distance: {' '.join(f'{x:>4}' for x in distances)}\n"
+    )
+
+
+def day_7(scale: float, rng: random.Random) -> str:
+    lines = []
+    for _ in range(_count(1000, scale)):
+        hand = "".join(rng.choices("AKQJT98765432", k=5))
+        lines.append(f"{hand} {rng.randint(1, 1000)}")
+    return "\n".join(lines) + "\n"
+
+
+def day_8(scale: float, rng: random.Random) -> str:
+    instructions = "".join(rng.choices("LR", k=263))
+    lines = []
+    starts = ["AAA"] + [f"G{k}A" for k in range(5)]
+    ends = ["ZZZ"] + [f"G{k}Z" for k in range(5)]
+    for k, (start, end) in enumerate(zip(starts, ends)):
+        # a chain start -> ... -> end that loops back behind its start
+        length = _count(60, scale) + rng.randint(0, 20)
+        chain = [start] + [f"N{k}X{i}" for i in range(length)] + [end]
+        for node, nxt in zip(chain, chain[1:] + [chain[1]]):
+            lines.append(f"{node} = ({nxt}, {nxt})")
+    rng.shuffle(lines)
+    return instructions + "\n\n" + "\n".join(lines) + "\n"
+
+
+def day_9(scale: float, rng: random.Random) -> str:
+    lines = []
+    for _ in range(_count(200, scale)):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 7))]
+        values = [
+            sum(c * x**i for i, c in enumerate(coefficients))
+            for x in range(21)
+        ]
+        lines.append(" ".join(map(str, values)))
+    return "\n".join(lines) + "\n"
+
+
+def day_10(scale: float, rng: random.Random) -> str:
+    side = _side(140, scale, minimum=4)
+    grid = [["."] * side for _ in range(side)]
+    for r in range(2, side - 2):
+        for c in range(2, side - 2):
+            grid[r][c] = rng.choice("|-LJ7F.")
+    # a rectangular loop one cell in from the border, starting top left
+    top, bottom, left, right = 1, side - 2, 1, side - 2
+    for c in range(left + 1, right):
+        grid[top][c] = grid[bottom][c] = "-"
+    for r in range(top + 1, bottom):
+        grid[r][left] = grid[r][right] = "|"
+    grid[top][left] = "S"
+    grid[top][right] = "7"
+    grid[bottom][right] = "J"
+    grid[bottom][left] = "L"
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def day_11(scale: float, rng: random.Random) -> str:
+    side = _side(140, scale)
+    empty_rows = set(rng.sample(range(side), side // 20))
+    empty_cols = set(rng.sample(range(side), side // 20))
+    lines = []
+    for r in range(side):
+        lines.append(
+            "".join(
+                "#"
+                if r not in empty_rows
+                and c not in empty_cols
+                and rng.random() < 0.02
+                else "."
+                for c in range(side)
+            )
+        )
+    return "\n".join(lines) + "\n"
+
+
+def day_12(scale: float, rng: random.Random) -> str:
+    lines = []
+    for _ in range(_count(1000, scale)):
+        springs = [rng.choice("#..") for _ in range(rng.randint(4, 20))]
+        if "#" not in springs:
+            springs[rng.randrange(len(springs))] = "#"
+        groups = [len(g) for g in "".join(springs).split(".") if g]
+        row = "".join("?" if rng.random() < 0.4 else s for s in springs)
+        lines.append(f"{row} {','.join(map(str, groups))}")
+    return "\n".join(lines) + "\n"
+
+
+def day_13(scale: float, rng: random.Random) -> str:
+    patterns = []
+    for _ in range(_count(100, scale)):
+        height, width = rng.randint(5, 17), rng.randint(5, 17)
+        rows = ["".join(rng.choices("#.", k=width)) for _ in range(height)]
+        # mirror the rows around a random axis, then crop
+        axis = rng.randint(1, height - 1)
+        mirrored = rows[:axis] + rows[:axis][::-1]
+        rows = mirrored[:height] if len(mirrored) >= height else mirrored
+        if rng.random() < 0.5:
+            rows = ["".join(col) for col in zip(*rows)]
+        patterns.append("\n".join(rows))
+    return "\n\n".join(patterns) + "\n"
+
+
+def day_14(scale: float, rng: random.Random) -> str:
+    side = _side(100, scale)
+    lines = [
+        "".join(rng.choices("O#.", weights=(2, 1, 7), k=side))
+        for _ in range(side)
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def day_15(scale: float, rng: random.Random) -> str:
+    labels = [
+        "".join(rng.choices(ALPHABET, k=rng.randint(2, 6)))
+        for _ in range(_count(500, scale))
+    ]
+    steps = []
+    for _ in range(_count(4000, scale)):
+        label = rng.choice(labels)
+        if rng.random() < 0.6:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+        else:
+            steps.append(f"{label}-")
+    return ",".join(steps) + "\n"
+
+
+def day_16(scale: float, rng: random.Random) -> str:
+    side = _side(110, scale)
+    lines = [
+        "".join(
+            rng.choice("/\\|-") if rng.random() < 0.08 else "."
+            for _ in range(side)
+        )
+        for _ in range(side)
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def day_17(scale: float, rng: random.Random) -> str:
+    side = _side(141, scale)
+    lines = ["".join(rng.choices("123456789", k=side)) for _ in range(side)]
+    return "\n".join(lines) + "\n"
+
+
+def _histogram_loop(
+    rng: random.Random, columns: int, max_width: int, max_height: int
+) -> list[tuple[str, int]]:
+    # the outline of a histogram never crosses itself and always closes
+    heights = [rng.randint(1, max_height)]
+    while len(heights) < columns:
+        if (h := rng.randint(1, max_height)) != heights[-1]:
+            heights.append(h)
+    widths = [rng.randint(1, max_width) for _ in range(columns)]
+
+    moves = [("U", heights[0]), ("R", widths[0])]
+    for prev, h, w in zip(heights, heights[1:], widths[1:]):
+        moves.append(("U", h - prev) if h > prev else ("D", prev - h))
+        moves.append(("R", w))
+    moves.extend([("D", heights[-1]), ("L", sum(widths))])
+    return moves
+
+
+def day_18(scale: float, rng: random.Random) -> str:
+    columns = _count(170, scale, minimum=2)
+    plan = _histogram_loop(rng, columns, 10, 10)
+    colors = _histogram_loop(
+        rng, columns, min(10**5, 0xFFFFF // columns), 10**5
+    )
+    index = {"R": 0, "D": 1, "L": 2, "U": 3}
+    lines = [
+        f"{d} {n} (#{m:05x}{index[c]})" for (d, n), (c, m) in zip(plan, colors)
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def day_19(scale: float, rng: random.Random) -> str:
+    n = _count(550, scale)
+    names = ["in"] + [name for name in _names(rng, n + 1, 3) if name != "in"][
+        : n - 1
+    ]
+
+    # grow a tree of workflows breadth first so every workflow is reachable
+    children = {name: [] for name in names}
+    for i, name in enumerate(names[1:], 1):
+        children[names[rng.randrange(i // 3, i)]].append(name)
+
+    lines = []
+    for name in names:
+        targets = children[name] + [
+            rng.choice("AR") for _ in range(rng.randint(1, 3))
+        ]
+        rng.shuffle(targets)
+        rules = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}"
+            f"{rng.randint(1, 4000)}:{t}"
+            for t in targets[:-1]
+        ]
+        lines.append(f"{name}{{{','.join(rules + [targets[-1]])}}}")
+    rng.shuffle(lines)
+
+    parts = [
+        "{" + ",".join(f"{c}={rng.randint(1, 4000)}" for c in "xmas") + "}"
+        for _ in range(_count(200, scale))
+    ]
+    return "\n".join(lines) + "\n\n" + "\n".join(parts) + "\n"
+
+
+def day_20(scale: float, rng: random.Random) -> str:
+    # binary counters of flip-flops, each inverted into hp, which feeds rx.
+    # Counter k first sends a high pulse to hp after 2 ** length presses.
+    chains = _count(4, scale)
+    lines = []
+    heads = []
+    for k in range(chains):
+        length = rng.randint(6, 12)
+        flipflops = [f"f{k}x{i}" for i in range(length)]
+        heads.append(flipflops[0])
+        for ff, nxt in zip(flipflops, flipflops[1:] + [f"inv{k}"]):
+            lines.append(f"%{ff} -> {nxt}")
+        lines.append(f"&inv{k} -> hp")
+    lines.append("&hp -> rx")
+    lines.append(f"broadcaster -> {', '.join(heads)}")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+def day_21(scale: float, rng: random.Random) -> str:
+    # an odd square with a clear border, middle row and middle column
+    side = 2 * _side(65, scale) + 1
+    mid = side // 2
+    grid = [
+        [
+            "#"
+            if 0 < r < side - 1
+            and 0 < c < side - 1
+            and r != mid
+            and c != mid
+            and rng.random() < 0.1
+            else "."
+            for c in range(side)
+        ]
+        for r in range(side)
+    ]
+    grid[mid][mid] = "S"
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def day_22(scale: float, rng: random.Random) -> str:
+    lines = []
+    z = 1
+    for _ in range(_count(1200, scale)):
+        start = [rng.randint(0, 9), rng.randint(0, 9), z]
+        end = list(start)
+        axis = rng.randrange(3)
+        top = 9 if axis < 2 else z + 3
+        end[axis] = min(end[axis] + rng.randint(0, 3), top)
+        z = end[2] + 1
+        lines.append(f"{','.join(map(str, start))}~{','.join(map(str, end))}")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+def day_23(scale: float, rng: random.Random) -> str:
+    # a lattice of 5x5 junctions joined by corridors; the corridors get
+    # longer with the scale, so the grid grows but the search space not
+    k = 5
+    length = max(2, round(26 * math.sqrt(scale)))
+    step = length + 1
+    side = 2 + (k - 1) * step + 1
+    grid = [["#"] * side for _ in range(side)]
+
+    def junction(i):
+        return 1 + i * step
+
+    for i in range(k):
+        for j in range(k):
+            r, c = junction(i), junction(j)
+            grid[r][c] = "."
+            # keep the first row and last column so the exit is reachable
+            right = j < k - 1 and (i == 0 or rng.random() > 0.15)
+            down = i < k - 1 and (j == k - 1 or rng.random() > 0.15)
+            if right:
+                for dc in range(1, step):
+                    grid[r][c + dc] = "."
+                grid[r][c + 1] = ">"
+            if down:
+                for dr in range(1, step):
+                    grid[r + dr][c] = "."
+                grid[r + 1][c] = "v"
+    grid[0][junction(0)] = "."
+    grid[side - 1][junction(k - 1)] = "."
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def day_24(scale: float, rng: random.Random) -> str:
+    # every hailstone is hit by the same rock at some integer time
+    rock = [rng.randint(2 * 10**14, 4 * 10**14) for _ in range(3)]
+    rock_v = [rng.randint(-300, 300) for _ in range(3)]
+    lines = []
+    for _ in range(_count(300, scale)):
+        t = rng.randint(10**11, 10**12)
+        v = [
+            rng.choice([x for x in range(-300, 301) if x != rv])
+            for rv in rock_v
+        ]
+        p = [pr + (rv - hv) * t for pr, rv, hv in zip(rock, rock_v, v)]
+        lines.append(f"{', '.join(map(str, p))} @ {', '.join(map(str, v))}")
+    return "\n".join(lines) + "\n"
+
+
+def day_25(scale: float, rng: random.Random) -> str:
+    # two well connected clusters joined by exactly three edges
+    size = _count(750, scale, minimum=8)
+    names = _names(rng, 2 * size, 3 if size < 2000 else 4)
+    rng.shuffle(names)
+
+    edges = set()
+    for cluster in (names[:size], names[size:]):
+        for i, node in enumerate(cluster[1:], 1):
+            for other in rng.sample(cluster[:i], min(i, 4)):
+                edges.add(frozenset((node, other)))
+        degree = {node: 0 for node in cluster}
+        for edge in edges:
+            for node in edge & degree.keys():
+                degree[node] += 1
+        for node, d in degree.items():
+            others = [x for x in cluster if x != node]
+            for other in rng.sample(others, max(0, 4 - d)):
+                edges.add(frozenset((node, other)))
+    for a, b in zip(rng.sample(names[:size], 3), rng.sample(names[size:], 3)):
+        edges.add(frozenset((a, b)))
+
+    adjacency = {}
+    for edge in edges:
+        a, b = sorted(edge)
+        adjacency.setdefault(a, []).append(b)
+    lines = [f"{a}: {' '.join(bs)}" for a, bs in adjacency.items()]
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+GENERATORS: dict[int, Callable[[float, random.Random], str]] = {
+    int(name.split("_")[1]): f
+    for name, f in list(globals().items())
+    if name.startswith("day_")
+}
+
+
+def generate(day: int, scale: float = 1.0, seed: int = 0) -> str:
+    """
+    Generate a synthetic puzzle input.
+
+    Args:
+        day (int): The day to generate an input for.
+        scale (float): The size of the input relative to the real input.
+        seed (int): The seed of the random number generator.
+
+    Returns:
+        str: The text of the puzzle input.
+    """
+    return GENERATORS[day](scale, random.Random(f"{day}:{seed}"))
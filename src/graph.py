@@ -0,0 +1,314 @@
+import heapq
+from array import array
+from collections import deque
+from typing import Container, Hashable, Iterable, Iterator, Sequence
+
+
+class Interner:
+    """
+    Maps hashable node names to dense integer ids, in order of appearance.
+    """
+
+    def __init__(self, names: Iterable[Hashable] = ()) -> None:
+        self.ids: dict[Hashable, int] = {}
+        self.names: list[Hashable] = []
+        for name in names:
+            self(name)
+
+    def __call__(self, name: Hashable) -> int:
+        """
+        Get the id of a name, assigning the next free one if it is new.
+
+        Args:
+            name (Hashable): The name of the node.
+
+        Returns:
+            int: The id of the node.
+        """
+        if (i := self.ids.get(name)) is None:
+            i = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return i
+
+    def __getitem__(self, i: int) -> Hashable:
+        return self.names[i]
+
+    def __contains__(self, name: Hashable) -> bool:
+        return name in self.ids
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class Graph:
+    """
+    A static graph in compressed sparse row form, over nodes 0 to n - 1.
+
+    The edges leaving node u are indices[indptr[u]:indptr[u + 1]], in the
+    order they were given, with their weights at the same positions. Flat
+    integer arrays take a fraction of the memory of dicts of dicts keyed by
+    tuples, and indexing them from Python is cheap.
+    """
+
+    def __init__(
+        self,
+        indptr: Sequence[int],
+        indices: Sequence[int],
+        weights: Sequence[int] | None = None,
+    ) -> None:
+        self.indptr = array("q", indptr)
+        self.indices = array("q", indices)
+        self.weights = None if weights is None else array("q", weights)
+
+    @classmethod
+    def from_edges(
+        cls,
+        n: int,
+        edges: Iterable[tuple[int, ...]],
+        directed: bool = True,
+    ) -> "Graph":
+        """
+        Build a graph from (u, v) or weighted (u, v, w) edges.
+
+        Args:
+            n (int): The number of nodes.
+            edges (Iterable[tuple[int, ...]]): The edges.
+            directed (bool): Whether to leave out the reverse edges.
+
+        Returns:
+            Graph: The graph.
+        """
+        adjacency = [[] for _ in range(n)]
+        weighted = None
+        for edge in edges:
+            u, v = edge[0], edge[1]
+            if weighted is None:
+                weighted = len(edge) > 2
+            adjacency[u].append(edge[1:])
+            if not directed:
+                adjacency[v].append((u, *edge[2:]))
+
+        indptr = [0]
+        for out in adjacency:
+            indptr.append(indptr[-1] + len(out))
+        indices = [edge[0] for out in adjacency for edge in out]
+        weights = (
+            [edge[1] for out in adjacency for edge in out]
+            if weighted
+            else None
+        )
+        return cls(indptr, indices, weights)
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def __repr__(self) -> str:
+        return f"Graph({len(self)} nodes, {len(self.indices)} edges)"
+
+    def neighbours(self, u: int) -> array:
+        return self.indices[self.indptr[u] : self.indptr[u + 1]]
+
+    def edges(self, u: int) -> Iterator[tuple[int, int]]:
+        """
+        Iterate over the edges leaving a node.
+
+        Args:
+            u (int): The node.
+
+        Yields:
+            tuple[int, int]: The target and weight of each edge, with a
+                weight of 1 for unweighted graphs.
+        """
+        start, end = self.indptr[u], self.indptr[u + 1]
+        weights = self.weights
+        for e in range(start, end):
+            yield self.indices[e], 1 if weights is None else weights[e]
+
+    def reverse(self) -> "Graph":
+        """
+        Build the graph with every edge reversed.
+
+        Returns:
+            Graph: The transposed graph.
+        """
+        return Graph.from_edges(
+            len(self),
+            (
+                (v, u) if self.weights is None else (v, u, w)
+                for u in range(len(self))
+                for v, w in self.edges(u)
+            ),
+        )
+
+    def bfs(self, source: int) -> list[int]:
+        """
+        Count the edges on the shortest paths from a node.
+
+        Args:
+            source (int): The node to start from.
+
+        Returns:
+            list[int]: The distance of every node, -1 if unreachable.
+        """
+        indptr, indices = self.indptr, self.indices
+        distance = [-1] * len(self)
+        distance[source] = 0
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            for e in range(indptr[u], indptr[u + 1]):
+                if distance[v := indices[e]] == -1:
+                    distance[v] = distance[u] + 1
+                    queue.append(v)
+        return distance
+
+    def dfs(self, source: int) -> Iterator[int]:
+        """
+        Visit the nodes reachable from a node in depth-first order.
+
+        Args:
+            source (int): The node to start from.
+
+        Yields:
+            int: The nodes, each once, in preorder.
+        """
+        indptr, indices = self.indptr, self.indices
+        seen = bytearray(len(self))
+        stack = [source]
+        while stack:
+            u = stack.pop()
+            if seen[u]:
+                continue
+            seen[u] = 1
+            yield u
+            # reversed, so the first neighbour is visited first
+            for e in range(indptr[u + 1] - 1, indptr[u] - 1, -1):
+                if not seen[indices[e]]:
+                    stack.append(indices[e])
+
+    def dijkstra(
+        self, sources: Iterable[int], targets: Container[int] = ()
+    ) -> list[float]:
+        """
+        Find the least total weight of a path from any source to each node.
+
+        Args:
+            sources (Iterable[int]): The nodes to start from.
+            targets (Container[int]): Stop as soon as the distance of any
+                of these is final.
+
+        Returns:
+            list[float]: The distance of every node, inf if unreachable.
+                After stopping early only the reached target and nodes
+                closer than it are final.
+        """
+        indptr, indices = self.indptr, self.indices
+        weights = self.weights or array("q", [1]) * len(indices)
+        distance = [float("inf")] * len(self)
+        queue = []
+        for source in sources:
+            distance[source] = 0
+            queue.append((0, source))
+        heapq.heapify(queue)
+
+        while queue:
+            d, u = heapq.heappop(queue)
+            if d > distance[u]:
+                continue
+            if u in targets:
+                break
+            for e in range(indptr[u], indptr[u + 1]):
+                v, dv = indices[e], d + weights[e]
+                if dv < distance[v]:
+                    distance[v] = dv
+                    heapq.heappush(queue, (dv, v))
+        return distance
+
+    def components(self) -> list[int]:
+        """
+        Label the connected components, treating every edge as undirected.
+
+        Returns:
+            list[int]: The component of every node, numbered from 0 in
+                order of their smallest node.
+        """
+        parent = list(range(len(self)))
+
+        def find(u: int) -> int:
+            while parent[u] != u:
+                parent[u] = parent[parent[u]]
+                u = parent[u]
+            return u
+
+        for u in range(len(self)):
+            for e in range(self.indptr[u], self.indptr[u + 1]):
+                a, b = find(u), find(self.indices[e])
+                if a != b:
+                    parent[max(a, b)] = min(a, b)
+
+        labels, roots = [], {}
+        for u in range(len(self)):
+            labels.append(roots.setdefault(find(u), len(roots)))
+        return labels
+
+    def min_cut(
+        self, source: int, sink: int, limit: int | None = None
+    ) -> tuple[int, list[bool]]:
+        """
+        Find a minimum edge cut between two nodes of an undirected graph.
+
+        Every edge has capacity one in both directions, so the maximum flow
+        is the number of edge-disjoint paths, found one breadth first
+        search at a time. The graph must hold every edge exactly once in
+        each direction, as built by from_edges with directed=False.
+
+        Args:
+            source (int): The node on one side of the cut.
+            sink (int): The node on the other side.
+            limit (int | None): Give up once the flow exceeds this, when
+                only small cuts are of interest.
+
+        Returns:
+            tuple[int, list[bool]]: The size of the cut, and which nodes
+                are on the side of the source. If the limit was exceeded
+                the size is limit + 1 and the side is meaningless.
+        """
+        indptr, indices = self.indptr, self.indices
+        # the position of the reverse of every edge
+        position = {
+            (u, indices[e]): e
+            for u in range(len(self))
+            for e in range(indptr[u], indptr[u + 1])
+        }
+        reverse = [
+            position[indices[e], u]
+            for u in range(len(self))
+            for e in range(indptr[u], indptr[u + 1])
+        ]
+        flow = [0] * len(indices)
+
+        cut = 0
+        while True:
+            via = [-1] * len(self)
+            via[source] = -2
+            queue = deque([source])
+            while queue and via[sink] == -1:
+                u = queue.popleft()
+                for e in range(indptr[u], indptr[u + 1]):
+                    v = indices[e]
+                    if via[v] == -1 and flow[e] < 1:
+                        via[v] = e
+                        queue.append(v)
+
+            if via[sink] == -1:
+                return cut, [e != -1 for e in via]
+
+            cut += 1
+            if limit is not None and cut > limit:
+                return cut, []
+            v = sink
+            while v != source:
+                e = via[v]
+                flow[e] += 1
+                flow[reverse[e]] -= 1
+                v = indices[reverse[e]]
@@ -0,0 +1,180 @@
+from functools import cached_property
+from typing import Iterable
+
+from .lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+class Grid:
+    """
+    A rectangular grid of characters backed by a numpy uint8 array.
+
+    The array is surrounded by a border of fill characters, so walking one
+    step (or pad steps) off any cell never leaves the array and needs no
+    bounds checks: the border just looks like a wall or empty space.
+    Solvers pick the fill that stops their walks at the edge, e.g. the
+    rocks around a garden or the walls around a city. Cells are addressed
+    either as (row, column) of the unpadded grid, or as flat indices into
+    the padded array, where the neighbours of i are i plus the offsets.
+    """
+
+    def __init__(
+        self, lines: Iterable[str], pad: int = 1, fill: str = "#"
+    ) -> None:
+        lines = list(lines)
+        self.height = len(lines)
+        self.width = len(lines[0]) if lines else 0
+        if any(len(line) != self.width for line in lines):
+            raise ValueError("all lines of a grid must have the same length")
+        self.pad = pad
+        self.fill = fill
+        cells = np.frombuffer("".join(lines).encode(), dtype=np.uint8)
+        self.array = np.pad(
+            cells.reshape(self.height, self.width),
+            pad,
+            constant_values=ord(fill),
+        )
+        self.stride = self.width + 2 * pad
+        # north, east, south, west
+        self.offsets = (-self.stride, 1, self.stride, -1)
+
+    def __repr__(self) -> str:
+        return f"Grid({self.height}x{self.width}, pad={self.pad})"
+
+    def __str__(self) -> str:
+        return "\n".join(row.tobytes().decode() for row in self.cells)
+
+    def __eq__(self, other: object):
+        if isinstance(other, str):
+            return self.cells == ord(other)
+        if isinstance(other, Grid):
+            return np.array_equal(self.array, other.array)
+        return NotImplemented
+
+    __hash__ = None
+
+    @property
+    def flat(self):
+        """
+        The padded array as a flat view, indexed by flat indices.
+
+        Returns:
+            np.ndarray: A 1-D view on the padded array.
+        """
+        return self.array.reshape(-1)
+
+    @property
+    def cells(self):
+        """
+        The grid without its border.
+
+        Returns:
+            np.ndarray: A (height, width) view on the padded array.
+        """
+        p = self.pad
+        return self.array[p : p + self.height, p : p + self.width]
+
+    @cached_property
+    def bytes(self) -> bytes:
+        """
+        The padded array as bytes, for fast scalar lookups from Python.
+
+        Indexing bytes is much cheaper than indexing a numpy array one
+        element at a time, so hot Python loops should use this instead of
+        flat. It is a snapshot and does not follow changes to the array.
+
+        Returns:
+            bytes: The characters of the padded array, by flat index.
+        """
+        return self.array.tobytes()
+
+    def row(self, r: int):
+        """
+        A view on one row of the grid, without the border.
+
+        Args:
+            r (int): The row.
+
+        Returns:
+            np.ndarray: The cells of the row.
+        """
+        return self.cells[r]
+
+    def column(self, c: int):
+        """
+        A view on one column of the grid, without the border.
+
+        Args:
+            c (int): The column.
+
+        Returns:
+            np.ndarray: The cells of the column.
+        """
+        return self.cells[:, c]
+
+    def mask(self, *chars: str):
+        """
+        Find the cells holding any of the given characters.
+
+        Args:
+            *chars (str): The characters to look for.
+
+        Returns:
+            np.ndarray: A (height, width) boolean mask.
+        """
+        return np.isin(self.cells, [ord(char) for char in chars])
+
+    def index(self, r: int, c: int) -> int:
+        """
+        Convert a (row, column) into a flat index.
+
+        Args:
+            r (int): The row.
+            c (int): The column.
+
+        Returns:
+            int: The index into the flat padded array.
+        """
+        return (r + self.pad) * self.stride + c + self.pad
+
+    def coords(self, i: int) -> tuple[int, int]:
+        """
+        Convert a flat index into a (row, column).
+
+        Args:
+            i (int): The index into the flat padded array.
+
+        Returns:
+            tuple[int, int]: The row and column, negative or past the end
+                for cells of the border.
+        """
+        r, c = divmod(int(i), self.stride)
+        return r - self.pad, c - self.pad
+
+    def where(self, char: str):
+        """
+        Find the flat indices of all cells holding a character.
+
+        Args:
+            char (str): The character to look for.
+
+        Returns:
+            np.ndarray: The flat indices, in row-major order.
+        """
+        return np.flatnonzero(self.flat == ord(char))
+
+    def find(self, char: str) -> int:
+        """
+        Find the flat index of the first cell holding a character.
+
+        Args:
+            char (str): The character to look for.
+
+        Returns:
+            int: The flat index.
+        """
+        i = self.bytes.find(char.encode())
+        if i == -1:
+            raise ValueError(f"{char!r} is not in the grid")
+        return i
@@ -0,0 +1,109 @@
+import argparse
+import subprocess
+import sys
+from typing import Iterable, NamedTuple
+
+from .runner import ROOT, discover
+
+BUDGET = 0.1
+
+
+class ImportTime(NamedTuple):
+    module: str
+    seconds: float
+    heaviest: list[tuple[str, float]]
+
+
+def import_time(module: str, repeat: int = 3, top: int = 3) -> ImportTime:
+    """
+    Measure the import of a module in a fresh interpreter.
+
+    Runs python -X importtime once per repeat and keeps the fastest run, so
+    the first run compiling the bytecode does not count against the module.
+
+    Args:
+        module (str): The name of the module to import.
+        repeat (int): The number of interpreters to start.
+        top (int): The number of heaviest dependencies to report.
+
+    Returns:
+        ImportTime: The cumulative import time and heaviest dependencies.
+    """
+    best = None
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        # lines look like "import time:  self [us] | cumulative | name",
+        # where the indentation of the name gives the depth of the import
+        timings = {}
+        for line in process.stderr.splitlines():
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            _, cumulative, name = line.split("|")
+            depth = (len(name) - len(name.lstrip())) // 2
+            timings[name.strip()] = (depth, int(cumulative) / 1e6)
+
+        total = timings.get(module, (0, 0.0))[1]
+        if best is None or total < best.seconds:
+            children = sorted(
+                (
+                    (name, seconds)
+                    for name, (depth, seconds) in timings.items()
+                    if depth == 1
+                ),
+                key=lambda item: -item[1],
+            )
+            best = ImportTime(module, total, children[:top])
+    return best
+
+
+def report(times: Iterable[ImportTime], budget: float = BUDGET) -> str:
+    """
+    Format import times, flagging modules over the budget.
+
+    Args:
+        times (Iterable[ImportTime]): The import times to format.
+        budget (float): The allowed import time of a module in seconds.
+
+    Returns:
+        str: A plain-text report, one line per module.
+    """
+    lines = []
+    for t in times:
+        flag = "OVER " if t.seconds > budget else "     "
+        heaviest = ", ".join(f"{name} {s:.3f}s" for name, s in t.heaviest)
+        lines.append(f"{flag}{t.module:<8} {t.seconds:7.3f}s  {heaviest}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Report the import time of the solver modules."
+    )
+    parser.add_argument("-d", "--days", type=int, nargs="+")
+    parser.add_argument(
+        "-b",
+        "--budget",
+        type=float,
+        default=BUDGET,
+        help="allowed import time of a module in seconds",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    modules = discover()
+    days = args.days or list(modules)
+    times = [import_time(modules[day], args.repeat) for day in days]
+    print(report(times, args.budget))
+    over = sum(t.seconds > args.budget for t in times)
+    print(f"{over} module(s) over the {args.budget:.3f}s budget")
+    return int(bool(over))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+import cProfile
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple
+
+from .cache import MISSING
+from .day import Day
+
+
+class Measurement(NamedTuple):
+    day: int
+    part: int
+    answer: Any
+    parse_seconds: float
+    solve_seconds: float
+    peak_memory: int | None = None
+    profile: str | None = None
+    error: str | None = None
+    cached: bool = False
+
+    @property
+    def seconds(self) -> float:
+        return self.parse_seconds + self.solve_seconds
+
+
+def measure(
+    day: int,
+    cls: type[Day],
+    input: str,
+    part: int,
+    memory: bool = False,
+    profile: Path | None = None,
+) -> Measurement:
+    """
+    Solve one part of a day, timing the parse and the solve separately.
+
+    The result cache is looked up first, and a hit skips the work
+    entirely, which is timed as solving. On a miss, parsing covers
+    constructing the day and its Day.parse method, and solving covers
+    Day.compute. Tracing memory slows both down considerably, so only
+    compare timings taken with the same flags.
+
+    Args:
+        day (int): The day number.
+        cls (type[Day]): The solver class of the day.
+        input (str): The path of the puzzle input.
+        part (int): The part of the puzzle, 1 or 2.
+        memory (bool): Whether to record the peak memory with tracemalloc.
+        profile (Path | None): Directory to dump cProfile stats to.
+
+    Returns:
+        Measurement: The answer, timings and optional instrumentation.
+    """
+    profiler = cProfile.Profile() if profile else None
+    parse = solve = 0.0
+    answer = error = peak = dump = None
+    cached = False
+
+    if memory:
+        tracemalloc.start()
+    if profiler:
+        profiler.enable()
+    try:
+        start = time.perf_counter()
+        instance = cls(input)
+        parse = time.perf_counter() - start
+
+        start = time.perf_counter()
+        answer = instance.cached_answer(part)
+        solve = time.perf_counter() - start
+        if not (cached := answer is not MISSING):
+            start = time.perf_counter()
+            if not instance.streaming:
+                instance.parse()
+            parse += time.perf_counter() - start
+
+            start = time.perf_counter()
+            answer = instance.compute(part)
+            solve = time.perf_counter() - start
+    except Exception as e:
+        error = repr(e)
+    finally:
+        if profiler:
+            profiler.disable()
+            Path(profile).mkdir(parents=True, exist_ok=True)
+            dump = str(Path(profile) / f"day_{day}_part_{part}.prof")
+            profiler.dump_stats(dump)
+        if memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    return Measurement(
+        day, part, answer, parse, solve, peak, dump, error, cached
+    )
+
+
+def to_json(measurements: Iterable[Measurement], path: Path) -> None:
+    """
+    Export measurements as JSON, tagged with when and where they were taken.
+
+    Args:
+        measurements (Iterable[Measurement]): The measurements to export.
+        path (Path): The file to write to.
+    """
+    document = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "measurements": [m._asdict() for m in measurements],
+    }
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2, default=str)
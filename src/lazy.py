@@ -0,0 +1,46 @@
+import importlib.util
+import sys
+from types import ModuleType
+
+# the names of the modules imported lazily so far
+_LAZY: set[str] = set()
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module on first attribute access instead of right away.
+
+    Heavy libraries like sympy and networkx take a large share of process
+    start-up, so solvers bind them lazily at module level and only pay for
+    the import when a part that needs them actually runs. A missing module
+    still fails here, at import time.
+
+    Args:
+        name (str): The absolute name of the module.
+
+    Returns:
+        ModuleType: The module, loaded when first used.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    _LAZY.add(name)
+    return module
+
+
+def load_lazy_imports() -> None:
+    """
+    Finish every lazy import so far, as if the modules had been used.
+
+    Lets benchmarks keep one-off import costs out of their timings.
+    """
+    for name in _LAZY:
+        # any attribute access runs the pending import
+        getattr(sys.modules[name], "__name__", None)
@@ -0,0 +1,117 @@
+import warnings
+
+from .lazy import lazy_import
+
+np = lazy_import("numpy")
+
+DIGITS = b"0123456789"
+
+
+def _table(keep: bytes) -> bytes:
+    # maps every byte not kept to a space
+    return bytes(b if b in keep else ord(" ") for b in range(256))
+
+
+# every byte but the digits (and the minus sign) separates numbers, line
+# breaks are kept to tell the rows apart
+_SIGNED = _table(DIGITS + b"-\n")
+_UNSIGNED = _table(DIGITS + b"\n")
+
+
+def _translate(
+    data: str | bytes | memoryview, delimiters: str | None, signed: bool
+) -> bytes:
+    if isinstance(data, str):
+        data = data.encode()
+    if delimiters is None:
+        return bytes(data).translate(_SIGNED if signed else _UNSIGNED)
+    delimiters = delimiters.replace("\n", "")
+    return bytes(data).translate(
+        bytes.maketrans(delimiters.encode(), b" " * len(delimiters))
+    )
+
+
+def _scan(text: bytes):
+    with warnings.catch_warnings():
+        # numpy only warns when it stops at something that is not a number
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(text, dtype=np.int64, sep=" ")
+        except DeprecationWarning:
+            raise ValueError("the text holds more than integers") from None
+
+
+def integers(
+    data: str | bytes | memoryview,
+    delimiters: str | None = None,
+    columns: int | None = None,
+    signed: bool = True,
+):
+    """
+    Parse all integers of a text into an int64 array in one pass.
+
+    The delimiters are translated to spaces and the result scanned by
+    numpy, so there is no Python-level work per number. By default any
+    character but a digit or minus sign is a delimiter, which skips labels
+    like "Card 1:" or "seed-to-soil map:" (with signed=False, as their
+    dashes are not minus signs). Values that may overflow int64 in later
+    arithmetic should be converted with tolist() first.
+
+    Args:
+        data (str | bytes | memoryview): The text to parse.
+        delimiters (str | None): The characters separating the numbers,
+            besides whitespace, or None for all non-numeric characters.
+        columns (int | None): Reshape into rows of this many numbers.
+        signed (bool): Whether a minus sign makes a number negative.
+
+    Returns:
+        np.ndarray: The numbers, flat or as (rows, columns).
+    """
+    array = _scan(_translate(data, delimiters, signed))
+    if columns is not None:
+        array = array.reshape(-1, columns)
+    return array
+
+
+def rows(
+    data: str | bytes | memoryview,
+    delimiters: str | None = None,
+    signed: bool = True,
+):
+    """
+    Parse a text of lines with equally many integers into a 2-D array.
+
+    Args:
+        data (str | bytes | memoryview): The text to parse.
+        delimiters (str | None): See integers.
+        signed (bool): See integers.
+
+    Raises:
+        ValueError: If a line that is not blank holds a different number
+            of integers than the first, e.g. none at all.
+
+    Returns:
+        np.ndarray: The numbers, one row per line.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    text = _translate(data, delimiters, signed)
+
+    # count the numbers, and the other characters, on every line
+    original = np.frombuffer(bytes(data), dtype=np.uint8)
+    translated = np.frombuffer(text, dtype=np.uint8)
+    line = np.cumsum(original == ord("\n"))
+    space = np.array([chr(b).isspace() for b in range(256)])
+    number = ~space[translated]
+    starts = number & ~np.concatenate(([False], number[:-1]))
+    counts = np.bincount(line[starts], minlength=len(line) and line[-1] + 1)
+    filled = np.bincount(
+        line[~space[original]], minlength=len(line) and line[-1] + 1
+    )
+
+    counts = counts[filled > 0]
+    if not len(counts):
+        return np.empty((0, 0), dtype=np.int64)
+    if not counts[0] or (counts != counts[0]).any():
+        raise ValueError("the lines hold different numbers of integers")
+    return _scan(text).reshape(-1, counts[0])
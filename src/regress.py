@@ -0,0 +1,247 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+from pathlib import Path
+from typing import Iterable
+
+from .bench import Sample, bench, exponent
+from .day import PART_NAMES
+from .generators import GENERATORS
+from .instrument import Measurement
+
+BASELINE = Path(__file__).resolve().parent.parent / "benchmarks/baseline.json"
+SCALES = (0.1, 0.2)
+
+
+def summarize(times: list[float]) -> dict[str, float]:
+    """
+    Summarize repeated timings by their median and quartiles.
+
+    Args:
+        times (list[float]): The timings of one day, part and scale.
+
+    Returns:
+        dict[str, float]: The median, first and third quartile.
+    """
+    if len(times) < 2:
+        return {"median": times[0], "q1": times[0], "q3": times[0]}
+    q1, median, q3 = statistics.quantiles(times, n=4, method="inclusive")
+    return {"median": median, "q1": q1, "q3": q3}
+
+
+def collect(
+    days: Iterable[int],
+    parts: Iterable[int],
+    scales: Iterable[float],
+    repeat: int = 5,
+    seed: int = 0,
+) -> dict:
+    """
+    Benchmark the solvers repeatedly and summarize the runs.
+
+    Timings come from runs without memory tracing, the peak memory from
+    one extra traced run, since tracing distorts the timings.
+
+    Args:
+        days (Iterable[int]): The days to benchmark.
+        parts (Iterable[int]): The parts to benchmark.
+        scales (Iterable[float]): The input scale factors to run.
+        repeat (int): The number of timed runs per day, part and scale.
+        seed (int): The seed of the input generators.
+
+    Returns:
+        dict: The summaries keyed by "day:part", then by scale.
+    """
+    days, parts, scales = list(days), list(parts), list(scales)
+    runs = [bench(days, parts, scales, seed) for _ in range(repeat)]
+    traced = bench(days, parts, scales, seed, memory=True)
+
+    results = {}
+    for key, samples in traced.items():
+        entry = {"scales": {}}
+        medians = []
+        for i, sample in enumerate(samples):
+            measurements = [run[key][i].measurement for run in runs]
+            errors = [m.error for m in measurements if m.error]
+            if errors:
+                entry["scales"][str(sample.scale)] = {"error": errors[0]}
+                continue
+            summary = summarize([m.seconds for m in measurements])
+            summary["peak_memory"] = sample.measurement.peak_memory
+            entry["scales"][str(sample.scale)] = summary
+            medians.append(
+                Sample(
+                    sample.scale,
+                    sample.size,
+                    Measurement(*key, None, 0.0, summary["median"]),
+                )
+            )
+        entry["exponent"] = exponent(medians)
+        results[f"{key[0]}:{key[1]}"] = entry
+    return results
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    threshold: float = 0.25,
+    min_seconds: float = 0.005,
+    min_bytes: int = 1 << 16,
+    exponent_tolerance: float = 0.5,
+) -> list[str]:
+    """
+    Find the parts that regressed compared to the baseline.
+
+    A timing regresses when its median exceeds the baseline median by more
+    than the threshold, by more than the spread (IQR) of either run and by
+    more than min_seconds. Peak memory regresses when it exceeds the
+    baseline by more than the threshold and min_bytes. The complexity
+    regresses when the fitted exponent grows by more than the tolerance,
+    provided the timings are well above min_seconds.
+
+    Args:
+        baseline (dict): The baseline results.
+        current (dict): The current results.
+        threshold (float): The allowed relative slowdown.
+        min_seconds (float): Slowdowns below this are noise.
+        min_bytes (int): Memory growth below this is noise.
+        exponent_tolerance (float): The allowed growth of the exponent.
+
+    Returns:
+        list[str]: A description of every regression.
+    """
+    regressions = []
+    for key, entry in current.items():
+        if key not in baseline:
+            continue
+        base = baseline[key]
+        for scale, now in entry["scales"].items():
+            then = base["scales"].get(scale)
+            if then is None or "error" in then:
+                continue
+            if "error" in now:
+                regressions.append(f"{key} x{scale}: {now['error']}")
+                continue
+
+            noise = max(now["q3"] - now["q1"], then["q3"] - then["q1"])
+            slower = now["median"] - then["median"]
+            if (
+                now["median"] > then["median"] * (1 + threshold)
+                and slower > noise
+                and slower > min_seconds
+            ):
+                regressions.append(
+                    f"{key} x{scale}: median {now['median']:.4f}s vs "
+                    f"{then['median']:.4f}s (IQR {noise:.4f}s)"
+                )
+
+            if now["peak_memory"] and then["peak_memory"]:
+                grown = now["peak_memory"] - then["peak_memory"]
+                if (
+                    now["peak_memory"] > then["peak_memory"] * (1 + threshold)
+                    and grown > min_bytes
+                ):
+                    regressions.append(
+                        f"{key} x{scale}: peak {now['peak_memory']} B vs "
+                        f"{then['peak_memory']} B"
+                    )
+
+        # fits on timings close to the noise floor are meaningless
+        largest = max(
+            (now.get("median", 0.0) for now in entry["scales"].values()),
+            default=0.0,
+        )
+        if (
+            entry["exponent"] is not None
+            and base["exponent"] is not None
+            and largest > 10 * min_seconds
+            and entry["exponent"] > base["exponent"] + exponent_tolerance
+        ):
+            regressions.append(
+                f"{key}: scales as n^{entry['exponent']:.2f} vs "
+                f"n^{base['exponent']:.2f}"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare solver performance against a stored baseline."
+    )
+    parser.add_argument("-d", "--days", type=int, nargs="+")
+    parser.add_argument(
+        "-p",
+        "--parts",
+        type=int,
+        nargs="+",
+        choices=sorted(PART_NAMES),
+        default=sorted(PART_NAMES),
+    )
+    parser.add_argument(
+        "-s", "--scales", type=float, nargs="+", default=list(SCALES)
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-b", "--baseline", type=Path, default=BASELINE)
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed relative slowdown or memory growth",
+    )
+    parser.add_argument(
+        "--exponent-tolerance",
+        type=float,
+        default=0.5,
+        help="allowed growth of the fitted complexity exponent",
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="write the current results as the new baseline",
+    )
+    args = parser.parse_args(argv)
+
+    days = args.days or sorted(GENERATORS)
+    current = collect(days, args.parts, args.scales, args.repeat, args.seed)
+
+    if args.update:
+        baseline = {}
+        if args.baseline.exists():
+            baseline = json.loads(args.baseline.read_text())["results"]
+        baseline.update(current)
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        document = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "results": dict(
+                sorted(
+                    baseline.items(),
+                    key=lambda item: tuple(map(int, item[0].split(":"))),
+                )
+            ),
+        }
+        args.baseline.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())["results"]
+    regressions = compare(
+        baseline,
+        current,
+        args.threshold,
+        exponent_tolerance=args.exponent_tolerance,
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    print(f"{len(regressions)} regression(s) in {len(current)} part(s)")
+    return int(bool(regressions))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+import argparse
+import importlib
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+from .day import PART_NAMES, Day
+from .instrument import Measurement, measure, to_json
+
+ROOT = Path(__file__).resolve().parent.parent
+INPUT_DIR = ROOT / "input"
+
+
+def discover(root: Path = ROOT) -> dict[int, str]:
+    """
+    Find the solver modules in the repository.
+
+    Args:
+        root (Path): The directory containing the day_N.py modules.
+
+    Returns:
+        dict[int, str]: The module names, keyed by day number.
+    """
+    modules = {}
+    for path in root.glob("day_*.py"):
+        if match := re.fullmatch(r"day_(\d+)", path.stem):
+            modules[int(match[1])] = path.stem
+    return dict(sorted(modules.items()))
+
+
+def load(day: int) -> type[Day]:
+    """
+    Import the module of a day and return its solver class.
+
+    Args:
+        day (int): The day number.
+
+    Returns:
+        type[Day]: The DayN class of that day.
+    """
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    module = importlib.import_module(f"day_{day}")
+    return getattr(module, f"Day{day}")
+
+
+def input_path(day: int, input_dir: Path = INPUT_DIR) -> Path:
+    return Path(input_dir) / f"day_{day}.txt"
+
+
+def disable_caches() -> None:
+    """Stop reading and writing the on-disk parse and result caches."""
+    Day.parse_cache = None
+    Day.result_cache = None
+
+
+def solve(
+    day: int,
+    part: int,
+    input: str,
+    memory: bool = False,
+    profile: Path | None = None,
+    cache: bool = True,
+) -> Measurement | None:
+    """
+    Solve one part of one day, catching any error it raises.
+
+    This is the unit of work sent to the process pool, so it only takes
+    picklable arguments and imports the solver inside the worker.
+
+    Args:
+        day (int): The day number.
+        part (int): The part of the puzzle, 1 or 2.
+        input (str): The path of the puzzle input.
+        memory (bool): Whether to record the peak memory.
+        profile (Path | None): Directory to dump cProfile stats to.
+        cache (bool): Whether to use the on-disk caches.
+
+    Returns:
+        Measurement | None: The answer and timings, or None if the day has
+            no such part.
+    """
+    if not cache:
+        disable_caches()
+    try:
+        cls = load(day)
+    except Exception as e:
+        return Measurement(day, part, None, 0.0, 0.0, error=repr(e))
+    if cls.part_name(part) is None:
+        return None
+    return measure(day, cls, input, part, memory, profile)
+
+
+def run(
+    days: Iterable[int],
+    parts: Iterable[int] = tuple(PART_NAMES),
+    workers: int | None = None,
+    input_dir: Path = INPUT_DIR,
+    memory: bool = False,
+    profile: Path | None = None,
+    cache: bool = True,
+) -> list[Measurement]:
+    """
+    Solve the requested days and parts in parallel.
+
+    Args:
+        days (Iterable[int]): The days to solve.
+        parts (Iterable[int]): The parts to solve for each day.
+        workers (int | None): The size of the process pool, defaults to
+            the number of CPUs.
+        input_dir (Path): The directory containing the day_N.txt inputs.
+        memory (bool): Whether to record the peak memory of each part.
+        profile (Path | None): Directory to dump cProfile stats to.
+        cache (bool): Whether to use the on-disk caches.
+
+    Returns:
+        list[Measurement]: The results, ordered by day and part.
+    """
+    tasks = [
+        (day, part, str(input_path(day, input_dir)), memory, profile, cache)
+        for day in days
+        for part in parts
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(solve, *task) for task in tasks]
+        results = [f.result() for f in futures]
+    return [r for r in results if r is not None]
+
+
+def table(results: list[Measurement]) -> str:
+    """
+    Format results as a plain-text timing table.
+
+    Args:
+        results (list[Measurement]): The results to format.
+
+    Returns:
+        str: The table, one row per day and part.
+    """
+    rows = [("Day", "Part", "Answer", "Parse (s)", "Solve (s)", "Peak (MB)")]
+    for r in results:
+        rows.append(
+            (
+                str(r.day),
+                str(r.part),
+                str(r.answer if r.error is None else f"error: {r.error}"),
+                f"{r.parse_seconds:.3f}",
+                f"{r.solve_seconds:.3f}",
+                "-" if r.peak_memory is None else f"{r.peak_memory / 1e6:.1f}",
+            )
+        )
+    rows.append(
+        (
+            "",
+            "",
+            "total",
+            f"{sum(r.parse_seconds for r in results):.3f}",
+            f"{sum(r.solve_seconds for r in results):.3f}",
+            "",
+        )
+    )
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = [
+        "  ".join(cell.rjust(width) for cell, width in zip(row, widths))
+        for row in rows
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Solve Advent of Code 2023 days in parallel."
+    )
+    parser.add_argument(
+        "-d", "--days", type=int, nargs="+", help="days to solve (all)"
+    )
+    parser.add_argument(
+        "-p",
+        "--parts",
+        type=int,
+        nargs="+",
+        choices=sorted(PART_NAMES),
+        default=sorted(PART_NAMES),
+        help="parts to solve (both)",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, help="number of worker processes"
+    )
+    parser.add_argument(
+        "-i",
+        "--input-dir",
+        type=Path,
+        default=INPUT_DIR,
+        help="directory containing the day_N.txt inputs",
+    )
+    parser.add_argument(
+        "-m",
+        "--memory",
+        action="store_true",
+        help="record peak memory with tracemalloc (slows solving down)",
+    )
+    parser.add_argument(
+        "--profile", type=Path, help="dump cProfile stats to this directory"
+    )
+    parser.add_argument(
+        "--json", type=Path, help="export the measurements to this file"
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="cache",
+        action="store_false",
+        help="recompute parsed inputs and answers instead of reusing them",
+    )
+    args = parser.parse_args(argv)
+
+    days = args.days or list(discover())
+    start = time.perf_counter()
+    results = run(
+        days,
+        args.parts,
+        args.workers,
+        args.input_dir,
+        args.memory,
+        args.profile,
+        args.cache,
+    )
+    print(table(results))
+    if args.cache:
+        hits = sum(r.cached for r in results)
+        print(f"result cache: {hits} hit(s), {len(results) - hits} miss(es)")
+    if args.json:
+        to_json(results, args.json)
+    print(f"wall time: {time.perf_counter() - start:.3f}s")
+    return int(any(r.error for r in results))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from .batch import solve_part, warm
+from .day import PART_NAMES
+from .runner import discover
+
+HOST, PORT = "127.0.0.1", 8023
+# the latencies kept per day for the percentiles
+SAMPLES = 1000
+
+
+class Busy(Exception):
+    pass
+
+
+class WorkerDied(Exception):
+    pass
+
+
+class Server(ThreadingHTTPServer):
+    """
+    A local HTTP server solving puzzles on a pool of warm workers.
+
+    Every worker imports all solvers up front and keeps the most recently
+    used Day instances, so repeated inputs skip parsing as well. Requests
+    beyond the in-flight limit are turned away instead of queueing up. A
+    worker dying breaks the pool, which fails the requests in flight and
+    is replaced by a fresh one.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int] = (HOST, PORT),
+        workers: int | None = None,
+        in_flight: int | None = None,
+    ) -> None:
+        # set before binding, which closes the server when it fails
+        self.pool = None
+        super().__init__(address, Handler)
+        self.workers = workers or os.cpu_count() or 1
+        self.days = discover()
+        self.pool = self._start_pool()
+        self.in_flight = in_flight or 4 * self.workers
+        self.slots = threading.BoundedSemaphore(self.in_flight)
+        self.verbose = False
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(lambda: deque(maxlen=SAMPLES))
+        self.errors = defaultdict(int)
+
+    def solve(self, day: int, part: int, input: str | bytes) -> dict:
+        """
+        Solve a part of a day on the pool and record the latency.
+
+        Args:
+            day (int): The day number.
+            part (int): The part of the puzzle, 1 or 2.
+            input (str | bytes): The path of the input, or its contents.
+
+        Raises:
+            Busy: If too many requests are in flight.
+            WorkerDied: If a worker of the pool died during the request.
+
+        Returns:
+            dict: The answer, or the error, and the latency in seconds.
+        """
+        if not self.slots.acquire(blocking=False):
+            raise Busy(f"more than {self.in_flight} requests in flight")
+        try:
+            start = time.perf_counter()
+            pool = self.pool
+            try:
+                result = pool.submit(solve_part, day, part, input).result()
+            except BrokenProcessPool as e:
+                self._replace(pool)
+                raise WorkerDied(f"a worker died: {e!r}") from e
+            result["seconds"] = time.perf_counter() - start
+        finally:
+            self.slots.release()
+
+        with self.lock:
+            self.latencies[day].append(result["seconds"])
+            self.errors[day] += "error" in result
+        return result
+
+    def _start_pool(self) -> ProcessPoolExecutor:
+        # spawned workers inherit neither the listening socket nor the
+        # state of the handler threads, from which the pool is replaced
+        context = multiprocessing.get_context("spawn")
+        return ProcessPoolExecutor(self.workers, context, initializer=warm)
+
+    def _replace(self, pool: ProcessPoolExecutor) -> None:
+        # only the first request to see the pool broken replaces it
+        with self.lock:
+            if self.pool is not pool:
+                return
+            self.pool = self._start_pool()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def metrics(self) -> dict:
+        """
+        Summarize the latencies of the recent requests of every day.
+
+        Returns:
+            dict: The count, errors and latency percentiles in seconds,
+                keyed by day.
+        """
+        with self.lock:
+            latencies = {day: list(s) for day, s in self.latencies.items()}
+            errors = dict(self.errors)
+
+        metrics = {}
+        for day, samples in sorted(latencies.items()):
+            if len(samples) > 1:
+                cuts = statistics.quantiles(samples, n=100, method="inclusive")
+                p50, p90, p99 = cuts[49], cuts[89], cuts[98]
+            else:
+                p50 = p90 = p99 = samples[0]
+            metrics[day] = {
+                "count": len(samples),
+                "errors": errors.get(day, 0),
+                "p50": p50,
+                "p90": p90,
+                "p99": p99,
+            }
+        return metrics
+
+    def server_close(self) -> None:
+        super().server_close()
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+
+class Handler(BaseHTTPRequestHandler):
+    """
+    POST /solve with {"day": 5, "part": 1, "input": "..."}, or a "path"
+    instead of the input, answers {"answer": ..., "seconds": ...}.
+    GET /metrics answers the latency percentiles per day.
+    """
+
+    server: Server
+
+    def _reply(self, status: HTTPStatus, body: Any) -> None:
+        data = json.dumps(body, default=str).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        if self.path != "/metrics":
+            return self._reply(HTTPStatus.NOT_FOUND, {"error": "not found"})
+        self._reply(HTTPStatus.OK, self.server.metrics())
+
+    def do_POST(self) -> None:
+        if self.path != "/solve":
+            return self._reply(HTTPStatus.NOT_FOUND, {"error": "not found"})
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+            day, part = int(request["day"]), int(request["part"])
+            if "input" in request:
+                input = request["input"].encode()
+            else:
+                input = str(request["path"])
+            if day not in self.server.days or part not in PART_NAMES:
+                raise ValueError(f"no solver for day {day} part {part}")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            return self._reply(HTTPStatus.BAD_REQUEST, {"error": repr(e)})
+
+        try:
+            result = self.server.solve(day, part, input)
+        except (Busy, WorkerDied) as e:
+            return self._reply(
+                HTTPStatus.SERVICE_UNAVAILABLE, {"error": repr(e)}
+            )
+        self._reply(HTTPStatus.OK, result)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Serve the solvers over HTTP on localhost."
+    )
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("-w", "--workers", type=int)
+    parser.add_argument(
+        "--in-flight",
+        type=int,
+        help="requests handled at once, beyond which they are turned away",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    with Server(
+        (args.host, args.port), args.workers, args.in_flight
+    ) as server:
+        server.verbose = args.verbose
+        print(f"serving on http://{args.host}:{server.server_port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())